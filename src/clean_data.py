@@ -1,9 +1,20 @@
 import pandas as pd
+import numpy as np
 import json
 import os
 import glob
 import zipfile
-import re
+import gzip
+import itertools
+import functools
+import fnmatch
+from concurrent.futures import ThreadPoolExecutor, wait
+import ijson
+import pyarrow as pa
+import pyarrow.json as paj
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+from numba import njit, prange
 
 # ==========================================
 # [Setup] Path Configuration & Constants
@@ -17,13 +28,139 @@ PROCESSED_DIR = os.path.join(BASE_DIR, 'data', 'processed')
 START_DATE = '2016-01-01'
 END_DATE = '2025-12-31' 
 
+# Storage format for intermediate (per-source) outputs; the final dataset is still exported as CSV
+PROCESSED_FMT = 'parquet'
+
 # Create output directory if it doesn't exist
 if not os.path.exists(PROCESSED_DIR):
     os.makedirs(PROCESSED_DIR)
 
+# Source D fields used downstream (everything else in the NYT dump is ignored at parse time)
+NEWS_SCHEMA = pa.schema([
+    ('date', pa.string()),
+    ('pub_date', pa.string()),
+    ('headline', pa.string()),
+    ('snippet', pa.string())
+])
+
+# Source D keywords ("Fear Index") and the number of articles parsed/aggregated per streaming batch
+# (at most 8 keywords: per-article flags are packed into a single uint8 bitmask)
+NEWS_KEYWORDS = ['inflation', 'recession', 'crisis', 'high price', 'layoff', 'unemployment']
+NEWS_BATCH_SIZE = 50_000
+
+# NEWS_KEYWORDS as one flat UTF-8 byte buffer + offsets (pattern k = bytes[offsets[k]:offsets[k+1]])
+NEWS_PATTERN_BYTES = np.frombuffer(''.join(NEWS_KEYWORDS).encode('utf-8'), dtype=np.uint8)
+NEWS_PATTERN_OFFSETS = np.cumsum([0] + [len(kw.encode('utf-8')) for kw in NEWS_KEYWORDS]).astype(np.int64)
+
+# ==========================================
+# [Helper] Background Writes of Intermediate Files
+# ==========================================
+# Parquet encoding/compression releases the GIL, so cleaners hand their output to this pool and return
+# immediately; the merge (or the next cleaner) runs while the file is flushed to disk.
+IO_POOL = ThreadPoolExecutor(max_workers=2)
+PENDING_WRITES = []
+
+def save_processed(df, save_path):
+    """
+    Queues df.to_parquet(save_path) on the background I/O pool.
+    - The writer gets its own copy, so the caller may keep modifying df while the file is written.
+    """
+    PENDING_WRITES.append(IO_POOL.submit(df.copy().to_parquet, save_path, compression='snappy'))
+
+def wait_for_writes():
+    """
+    Blocks until all queued intermediate writes are on disk, reporting any that failed.
+    """
+    done, _ = wait(PENDING_WRITES)
+    PENDING_WRITES.clear()
+    for future in done:
+        if future.exception() is not None:
+            print(f"Error writing intermediate file: {future.exception()}")
+
+# ==========================================
+# [Helper] Integer Month Keys
+# ==========================================
+def month_ids(dates):
+    """
+    Maps datetimes to contiguous integer month keys (year * 12 + month - 1).
+    """
+    dates = pd.DatetimeIndex(dates)
+    return (dates.year.to_numpy(dtype=np.int64) * 12) + dates.month.to_numpy(dtype=np.int64) - 1
+
+def month_index(first_month_id, n_months):
+    """
+    Builds the month-start DatetimeIndex for n_months consecutive keys starting at first_month_id.
+    """
+    start = pd.Timestamp(year=int(first_month_id) // 12, month=int(first_month_id) % 12 + 1, day=1)
+    return pd.date_range(start=start, periods=n_months, freq='MS', name='date')
+
+def downcast_floats(df):
+    """
+    Downcasts every float64 column to float32 (ample precision for prices, rates and index levels).
+    """
+    return df.astype({c: 'float32' for c in df.select_dtypes('float64').columns})
+
+def downcast_counts(df):
+    """
+    Downcasts non-negative integer count columns to the smallest nullable integer type that holds their maximum.
+    - Keyword counts fit in Int16; the total over a full month of archive articles may need Int32.
+    """
+    dtypes = {}
+    for c in df.columns:
+        max_count = df[c].max()
+        dtypes[c] = next(t for t in ('Int16', 'Int32', 'Int64') if max_count <= np.iinfo(t.lower()).max)
+    return df.astype(dtypes)
+
+# ==========================================
+# [Helper] Per-Process Memoization of Cleaners
+# ==========================================
+# clean function name -> (raw input mtimes, cleaned DataFrame)
+CLEAN_CACHE = {}
+
+def raw_mtimes(raw_patterns):
+    """
+    Returns a sorted tuple of (path, mtime) for every raw file matching raw_patterns (globs relative to RAW_DIR).
+    """
+    paths = [p for pattern in raw_patterns for p in glob.glob(os.path.join(RAW_DIR, pattern))]
+    return tuple(sorted((p, os.path.getmtime(p)) for p in paths))
+
+def memoized_result(func_name, raw_patterns):
+    """
+    Returns a copy of the memoized result of a cleaner if its raw inputs are unchanged, otherwise None.
+    """
+    cached = CLEAN_CACHE.get(func_name)
+    if cached is not None and cached[0] == raw_mtimes(raw_patterns):
+        return cached[1].copy()
+    return None
+
+def memoize_by_mtimes(raw_patterns):
+    """
+    Decorator: Memoizes a clean_*() function for the lifetime of the process, keyed on its raw input mtimes.
+    - Repeated calls (e.g. from a notebook) reuse the in-memory DataFrame until a raw file changes.
+    - The patterns are exposed as wrapper.raw_patterns for the on-disk cache check in load_or_clean.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper():
+            result = memoized_result(func.__name__, raw_patterns)
+            if result is not None:
+                print(f"\n[Memo] {func.__name__}: raw inputs unchanged, reusing in-memory result")
+                return result
+
+            signature = raw_mtimes(raw_patterns)
+            result = func()
+            if result is not None and not result.empty:
+                CLEAN_CACHE[func.__name__] = (signature, result.copy())
+            return result
+
+        wrapper.raw_patterns = raw_patterns
+        return wrapper
+    return decorator
+
 # ==========================================
 # 1. Source A: CPI Data Cleaning
 # ==========================================
+@memoize_by_mtimes(['source_a_*.json'])
 def clean_cpi_data():
     """
     Cleans [Source A] CPI JSON data: Flattens structure, renames columns, and calculates YoY(Year-Over-Year) inflation.
@@ -42,9 +179,6 @@ def clean_cpi_data():
         return None
 
     # 2. Parse Data & Count Raw Records
-    all_records = []
-    raw_total_count = 0  # Counter for raw data points
-    
     # Series ID Map
     series_map = {
         "CUUR0000SA0": "CPI_Total",
@@ -57,46 +191,36 @@ def clean_cpi_data():
         print("Error: Invalid JSON structure.")
         return None
 
-    for series in raw_data['Results']['series']:
+    all_series = raw_data['Results']['series']
+    raw_total_count = sum(len(series['data']) for series in all_series)  # Counter for raw data points
+
+    # Build one date-indexed column per series straight from its list of records (no per-item Python loop)
+    cols = {}
+    for series in all_series:
         series_id = series['seriesID']
-        col_name = series_map.get(series_id, series_id)
-        
-        # Add the number of data points in this series to the total count
-        raw_total_count += len(series['data'])
-        
-        for item in series['data']:
-            year = item['year']
-            period = item['period'] 
-            value = item['value']
-            
-            # Filter: Valid months (M01-M12)
-            if 'M01' <= period <= 'M12':
-                month = period[1:] 
-                date_str = f"{year}-{month}-01"
-                
-                all_records.append({
-                    "date": date_str,
-                    "type": col_name,
-                    "value": float(value)
-                })
-
-    # 3. DataFrame Conversion
-    df = pd.DataFrame(all_records)
-    
-    # Pivot
-    df_pivot = df.pivot(index='date', columns='type', values='value')
-    
-    # 4. Index Processing
-    df_pivot.index = pd.to_datetime(df_pivot.index)
-    df_pivot.sort_index(inplace=True)
+        df_series = pd.DataFrame(series['data'], columns=['year', 'period', 'value'])
+
+        # Filter: Valid months (M01-M12)
+        df_series = df_series[df_series['period'].str.fullmatch(r'M0[1-9]|M1[0-2]')]
+
+        dates = pd.to_datetime(
+            df_series['year'] + '-' + df_series['period'].str[1:] + '-01', format='%Y-%m-%d'
+        )
+        cols[series_map.get(series_id, series_id)] = pd.Series(
+            df_series['value'].to_numpy(dtype=np.float32), index=pd.DatetimeIndex(dates, name='date')
+        )
+
+    # 3. DataFrame Conversion: Wide frame assembled directly (no long format + pivot)
+    # Columns in alphabetical order; the date index is sorted here (BLS lists newest first) because pct_change is positional
+    df_pivot = pd.concat({name: cols[name] for name in sorted(cols)}, axis=1, sort=False).sort_index()
     
-    # 5. Feature Engineering (YoY %)
-    for col in df_pivot.columns:
-        df_pivot[f"{col}_YoY"] = df_pivot[col].pct_change(periods=12) * 100
+    # 4. Feature Engineering (YoY %): One frame-wide pct_change, appended in a single concat
+    yoy = df_pivot.pct_change(periods=12).mul(100).astype('float32').add_suffix('_YoY')
+    df_pivot = downcast_floats(pd.concat([df_pivot, yoy], axis=1))
 
-    # 6. Save & Print Stats
-    save_path = os.path.join(PROCESSED_DIR, 'clean_cpi.csv')
-    df_pivot.to_csv(save_path)
+    # 5. Save & Print Stats
+    save_path = os.path.join(PROCESSED_DIR, f'clean_cpi.{PROCESSED_FMT}')
+    save_processed(df_pivot, save_path)
     
     # Print Statistics for Report
     print(f"  -> Raw Data Points Scanned: {raw_total_count}")
@@ -108,6 +232,7 @@ def clean_cpi_data():
 # ==========================================
 # 2. Source B: Energy Data Cleaning
 # ==========================================
+@memoize_by_mtimes(['source_b_*.json'])
 def clean_energy_data():
     """
     Cleans [Source B] Energy JSON data (List of Lists): Flattens raw table data and resamples to monthly mean.
@@ -122,7 +247,7 @@ def clean_energy_data():
         "Oil_Price": "source_b_energy_crude_wti_raw.json"
     }
     
-    combined_df = pd.DataFrame()
+    frames = []  # One monthly frame per fuel, combined once after the loop
 
     for col_name, filename in files.items():
         file_path = os.path.join(RAW_DIR, filename)
@@ -144,22 +269,22 @@ def clean_energy_data():
             continue
 
         # Parsing raw list of lists
-        parsed_data = []
-        for row in raw_list:
-            if not row or not isinstance(row, list): continue
-            
-            # Extract Year from the first element (Header)
-            header_date = row[0]
-            try:
-                year_str = str(pd.to_datetime(header_date, errors='coerce').year)
-                if year_str == 'nan': continue
-            except: continue 
+        rows = [row for row in raw_list if row and isinstance(row, list)]
+        
+        # Extract Year from the first element (Header), parsed once for all rows
+        header_years = pd.to_datetime(
+            pd.Series([row[0] for row in rows], dtype=object), format='%Y-%b', errors='coerce'
+        ).dt.strftime('%Y')
+
+        # Collect raw (Date, Price) strings; conversion happens once per file below
+        dates = []
+        vals = []
+        for row, year_str in zip(rows, header_years):
+            if not isinstance(year_str, str): continue
 
-            # Parse data pairs (Date, Price)
+            # Parse data pairs (Date, Price), ignoring an incomplete trailing pair
             data_pairs = row[1:]
-            for i in range(0, len(data_pairs), 2):
-                if i+1 >= len(data_pairs): break # Incomplete pair
-                
+            for i in range(0, len(data_pairs) - 1, 2):
                 date_part = data_pairs[i] 
                 price_str = data_pairs[i+1] 
                 
@@ -167,47 +292,42 @@ def clean_energy_data():
                 if not date_part.strip() or not price_str.strip(): continue
                 
                 # Construct full date string (YYYY-MM-DD)
-                full_date_str = f"{year_str}-{date_part.replace('/', '-')}"
-                
-                try:
-                    val = float(price_str)
-                    parsed_data.append({
-                        "date": pd.to_datetime(full_date_str, errors='coerce'),
-                        col_name: val
-                    })
-                except ValueError:
-                    continue
-
-        df_temp = pd.DataFrame(parsed_data)
+                dates.append(f"{year_str}-{date_part.replace('/', '-')}")
+                vals.append(price_str)
+
+        s_date = pd.to_datetime(pd.Series(dates, dtype=object), format='%Y-%m-%d', errors='coerce')
+        s_val = pd.to_numeric(pd.Series(vals, dtype=object), errors='coerce')
+        df_temp = pd.DataFrame({col_name: s_val.to_numpy()}, index=pd.DatetimeIndex(s_date, name='date'))
+        df_temp = df_temp[df_temp.index.notna()].dropna()
         
         if df_temp.empty:
             print(f"  -> [Warning] No valid data extracted for {col_name}.")
             continue
-            
-        df_temp.dropna(subset=['date'], inplace=True)
-        df_temp.set_index('date', inplace=True)
         
-        # Resample to Monthly Mean (MS: Month Start)
-        df_monthly = df_temp.resample('MS').mean()
+        # Monthly Mean (MS: Month Start) via integer month keys instead of a timestamp grouper
+        ids = month_ids(df_temp.index)
+        first_month = ids.min()
+        sums = np.bincount(ids - first_month, weights=df_temp[col_name].to_numpy(dtype=np.float64))
+        counts = np.bincount(ids - first_month)
+        with np.errstate(invalid='ignore'):
+            means = sums / counts  # Months without any weekly price stay NaN
+        df_monthly = pd.DataFrame({col_name: means}, index=month_index(first_month, len(means)))
         
         print(f"  -> {col_name}: {len(df_monthly)} months extracted.")
-        
-        if combined_df.empty:
-            combined_df = df_monthly
-        else:
-            combined_df = combined_df.join(df_monthly, how='outer')
+        frames.append(df_monthly)
+
+    # Outer Join all fuels on the Date index in a single concat (sorting and period filtering happen once, in the merge)
+    combined_df = pd.concat(frames, axis=1, join='outer', sort=False) if frames else pd.DataFrame()
 
     if combined_df.empty:
         print("  -> [Error] Combined Energy DataFrame is empty.")
         return pd.DataFrame()
 
-    # Filter by date range
-    combined_df = combined_df[START_DATE:END_DATE]
-    combined_df.sort_index(inplace=True)
+    combined_df = downcast_floats(combined_df)
 
     # Save intermediate file
-    save_path = os.path.join(PROCESSED_DIR, 'clean_energy.csv')
-    combined_df.to_csv(save_path)
+    save_path = os.path.join(PROCESSED_DIR, f'clean_energy.{PROCESSED_FMT}')
+    save_processed(combined_df, save_path)
     print(f"  -> Saved cleaned Energy data to {save_path}")
     
     return combined_df
@@ -215,11 +335,12 @@ def clean_energy_data():
 # ==========================================
 # 3. Source C: Labor Data Cleaning
 # ==========================================
+@memoize_by_mtimes(['source_c_*.csv'])
 def clean_labor_data():
     """
-    Cleans [Source C] Unemployment CSV data: Melts matrix format (Year x Month) to time-series.
+    Cleans [Source C] Unemployment CSV data: Reshapes matrix format (Year x Month) to time-series.
     """
-    print("\n[Cleaning] Source C: Labor Market Data (Melting)...")
+    print("\n[Cleaning] Source C: Labor Market Data (Reshaping)...")
     
     files = {
         "Unemp_Total": "source_c_unemployment_total_raw.csv",
@@ -227,48 +348,33 @@ def clean_labor_data():
         "Unemp_Women": "source_c_unemployment_women_raw.csv"
     }
     
-    month_map = {
-        "Jan": "01", "Feb": "02", "Mar": "03", "Apr": "04", "May": "05", "Jun": "06",
-        "Jul": "07", "Aug": "08", "Sep": "09", "Oct": "10", "Nov": "11", "Dec": "12"
-    }
+    months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
     
-    combined_df = pd.DataFrame()
+    frames = []  # One monthly frame per series, combined once after the loop
     raw_total_count = 0  # Counter for raw data points
 
     for col_name, filename in files.items():
         file_path = os.path.join(RAW_DIR, filename)
         try:
-            df_raw = pd.read_csv(file_path)
+            # Arrow's multi-threaded C++ parser converts the month cells to float32 during the parse
+            df_raw = pd.read_csv(
+                file_path, engine='pyarrow', dtype_backend='pyarrow', dtype={m: 'float32' for m in months}
+            )
             # Strip whitespace from column names
             df_raw.columns = [c.strip() for c in df_raw.columns]
             
-            # Melt: Transform wide format (Year x Month) to long format (Date-Value)
-            # This creates one row per month per year
-            df_melted = df_raw.melt(id_vars=["Year"], var_name="Month_Name", value_name="Rate")
-            
-            # Count raw data points (Total months extracted from the file)
-            raw_total_count += len(df_melted)
-            
-            # Filter valid month names
-            df_melted = df_melted[df_melted['Month_Name'].isin(month_map.keys())]
+            # Count raw data points (Every non-Year cell in the file)
+            raw_total_count += df_raw.shape[0] * (df_raw.shape[1] - 1)
             
-            # Construct Date column
-            df_melted['Month_Num'] = df_melted['Month_Name'].map(month_map)
-            df_melted['date'] = pd.to_datetime(
-                df_melted['Year'].astype(str) + "-" + df_melted['Month_Num'] + "-01"
-            )
-            
-            # Select relevant columns and index
-            df_clean = df_melted[['date', 'Rate']].sort_values('date').set_index('date')
-            df_clean.rename(columns={'Rate': col_name}, inplace=True)
-            
-            # Convert numeric types
-            df_clean[col_name] = pd.to_numeric(df_clean[col_name], errors='coerce')
+            # Melt: Flatten the (Year x Month) matrix row by row into a monthly time-series
+            vals = df_raw.reindex(columns=months).to_numpy(dtype=np.float32, na_value=np.nan).ravel(order='C')
+            years = np.repeat(df_raw['Year'].to_numpy(dtype=np.int64), len(months))
+            month_nums = np.tile(np.arange(1, len(months) + 1), len(df_raw))
             
-            if combined_df.empty:
-                combined_df = df_clean
-            else:
-                combined_df = combined_df.join(df_clean, how='outer')
+            # Construct Date index
+            dates = pd.to_datetime(pd.DataFrame({'year': years, 'month': month_nums, 'day': 1}))
+            df_clean = pd.DataFrame({col_name: vals}, index=pd.DatetimeIndex(dates, name='date'))
+            frames.append(df_clean)
                 
         except FileNotFoundError:
             print(f"  -> [Skip] {filename} not found.")
@@ -277,13 +383,12 @@ def clean_labor_data():
             print(f"  -> [Error] Processing {col_name}: {e}")
             continue
 
-    # Filter by date range
+    # Outer Join all series on the Date index in a single concat (sorting and period filtering happen once, in the merge)
+    combined_df = pd.concat(frames, axis=1, join='outer', sort=False) if frames else pd.DataFrame()
+
     if not combined_df.empty:
-        combined_df = combined_df[START_DATE:END_DATE]
-        combined_df.sort_index(inplace=True)
-    
-        save_path = os.path.join(PROCESSED_DIR, 'clean_unemployment.csv')
-        combined_df.to_csv(save_path)
+        save_path = os.path.join(PROCESSED_DIR, f'clean_unemployment.{PROCESSED_FMT}')
+        save_processed(combined_df, save_path)
         
         # Print Statistics for Report
         print(f"  -> Raw Data Points Scanned: {raw_total_count}")
@@ -297,89 +402,215 @@ def clean_labor_data():
 # ==========================================
 # 4. Source D: News Sentiment Cleaning
 # ==========================================
+def raw_opener(filepath):
+    """
+    Returns a zero-argument binary opener for a raw file, decompressing gzipped (*.gz) files on the fly.
+    """
+    return functools.partial(gzip.open if filepath.endswith('.gz') else open, filepath, 'rb')
+
+def is_json_array(open_stream):
+    """
+    Returns True if the stream holds a single JSON array (legacy get_data.py output) rather than line-delimited JSON.
+    - open_stream: zero-argument callable returning a binary file object (a path opener or a ZIP member opener).
+    """
+    with open_stream() as f:
+        return f.read(1024).lstrip().startswith(b'[')
+
+def iter_news_dataset(filepaths, file_format=None, batch_size=NEWS_BATCH_SIZE):
+    """
+    Streams line-delimited [Source D] NYT JSON files as one Arrow dataset, yielding DataFrames restricted to NEWS_SCHEMA.
+    - Files are scanned by Arrow's multi-threaded C++ reader (*.gz files are decompressed by extension).
+    - file_format: Arrow dataset format; defaults to JSON Lines ('parquet' for the recent-article table).
+      NEWS_SCHEMA fields a file lacks (e.g. 'pub_date' in the Parquet table) come back as nulls.
+    - The analysis period is applied to each Arrow batch as a coarse filter on the ISO date strings, so out-of-range
+      articles are never materialized; the exact Timestamp filter is still applied in count_news_keywords.
+    Yields: (records read, DataFrame of the in-period ones) per batch.
+    """
+    if file_format is None:
+        file_format = ds.JsonFileFormat(
+            parse_options=paj.ParseOptions(explicit_schema=NEWS_SCHEMA, unexpected_field_behavior='ignore')
+        )
+    dataset = ds.dataset(filepaths, schema=NEWS_SCHEMA, format=file_format)
+    period_end = (pd.Timestamp(END_DATE) + pd.Timedelta(days=1)).strftime('%Y-%m-%d')
+
+    # Filtered per batch (not in the scan) so the records outside the period are still counted
+    for batch in dataset.to_batches(columns=NEWS_SCHEMA.names, batch_size=batch_size):
+        published = pc.coalesce(batch.column('date'), batch.column('pub_date'))
+        in_period = pc.and_(pc.greater_equal(published, START_DATE), pc.less(published, period_end))
+        yield batch.num_rows, batch.filter(in_period).to_pandas(types_mapper=pd.ArrowDtype)
+
+def iter_news_array(open_stream, batch_size=NEWS_BATCH_SIZE):
+    """
+    Streams one legacy JSON-array [Source D] file with ijson, batch_size articles at a time, as NEWS_SCHEMA DataFrames.
+    Yields: (records read, DataFrame) per batch.
+    """
+    with open_stream() as f:
+        articles = (item for item in ijson.items(f, 'item') if isinstance(item, dict))
+        while True:
+            chunk = list(itertools.islice(articles, batch_size))
+            if not chunk:
+                break
+            columns = {name: [item.get(name) for item in chunk] for name in NEWS_SCHEMA.names}
+            yield len(chunk), pa.table(columns, schema=NEWS_SCHEMA).to_pandas(types_mapper=pd.ArrowDtype)
+
+def iter_news_lines(open_stream):
+    """
+    Streams one line-delimited [Source D] stream (e.g. a ZIP member) block by block with Arrow's C++ JSON reader.
+    Yields: (records read, DataFrame) per block.
+    """
+    parse_options = paj.ParseOptions(explicit_schema=NEWS_SCHEMA, unexpected_field_behavior='ignore')
+    with open_stream() as f:
+        for batch in paj.open_json(f, parse_options=parse_options):
+            yield batch.num_rows, batch.to_pandas(types_mapper=pd.ArrowDtype)
+
+@njit(parallel=True, cache=True)
+def keyword_bitmask_kernel(offsets, data, patterns, pattern_offsets):
+    """
+    Single pass multi-keyword substring search over an Arrow string buffer (compiled by Numba).
+    - offsets/data: Arrow StringArray layout (text i = data[offsets[i]:offsets[i+1]]).
+    - Returns one uint8 per text where bit k is set if pattern k occurs in it.
+    """
+    n_texts = len(offsets) - 1
+    n_patterns = len(pattern_offsets) - 1
+    out = np.zeros(n_texts, dtype=np.uint8)
+    for i in prange(n_texts):
+        start, end = offsets[i], offsets[i + 1]
+        found = np.uint8(0)
+        for k in range(n_patterns):
+            p_start = pattern_offsets[k]
+            p_len = pattern_offsets[k + 1] - p_start
+            for j in range(start, end - p_len + 1):
+                matched = True
+                for q in range(p_len):
+                    if data[j + q] != patterns[p_start + q]:
+                        matched = False
+                        break
+                if matched:
+                    found |= np.uint8(1 << k)
+                    break
+        out[i] = found
+    return out
+
+def count_news_keywords(df):
+    """
+    Counts NEWS_KEYWORDS mentions (and their total, News_Total_Counting) per month for one batch of articles.
+    - Returns an empty DataFrame if no article falls inside the analysis period.
+    """
+    # Date Handling: Use 'date', falling back to 'pub_date'
+    dates = pd.to_datetime(df['date'].fillna(df['pub_date']), errors='coerce')
+    
+    # Remove Timezone info for consistency
+    if dates.dt.tz is not None:
+        dates = dates.dt.tz_localize(None)
+
+    # Filter by analysis period (NaT compares False and is dropped here as well)
+    in_range = ((dates >= START_DATE) & (dates <= END_DATE)).to_numpy(dtype=bool)
+    if not in_range.any():
+        return pd.DataFrame()
+    df = df[in_range]
+    
+    # Text Cleaning: Combine Headline + Snippet (missing parts become '') and lower-case, all in Arrow's C++ kernels
+    full_text = pc.utf8_lower(pc.binary_join_element_wise(
+        pa.array(df['headline'].array, type=pa.string()), pa.array(df['snippet'].array, type=pa.string()), ' ',
+        null_handling='replace', null_replacement=''
+    ))
+
+    # Pack all keyword flags into one uint8 bitmask per article (bit k = NEWS_KEYWORDS[k] present)
+    # Text is already lower-cased, so the kernel scans the raw UTF-8 bytes without case folding
+    text_arr = full_text.cast(pa.large_string())
+    _, offsets_buf, data_buf = text_arr.buffers()
+    offsets = np.frombuffer(offsets_buf, dtype=np.int64)[text_arr.offset:text_arr.offset + len(text_arr) + 1]
+    data = np.frombuffer(data_buf, dtype=np.uint8) if data_buf is not None else np.zeros(0, dtype=np.uint8)
+    mask = keyword_bitmask_kernel(offsets, data, NEWS_PATTERN_BYTES, NEWS_PATTERN_OFFSETS)
+
+    # Aggregation: Histogram of bitmask values per month, then unpack bits once per (month, mask value)
+    ids = month_ids(dates[in_range])
+    first_month = ids.min()
+    n_months = ids.max() - first_month + 1
+    hist = np.bincount((ids - first_month) * 256 + mask, minlength=n_months * 256).reshape(n_months, 256)
+    bits = np.unpackbits(np.arange(256, dtype=np.uint8)[:, None], axis=1, bitorder='little')[:, :len(NEWS_KEYWORDS)]
+
+    # Per-keyword flags plus their popcount, so the total comes out of the same product
+    weights = np.column_stack([bits, bits.sum(axis=1)])
+    columns = [f"News_Count_{kw.title().replace(' ', '_')}" for kw in NEWS_KEYWORDS] + ['News_Total_Counting']
+    return pd.DataFrame(hist @ weights, index=month_index(first_month, n_months), columns=columns)
+
+@memoize_by_mtimes(['source_d_*.json', 'source_d_*.json.gz', 'source_d_*.parquet', 'source_d_*.zip'])
 def clean_news_data():
     """
-    Cleans [Source D] NYT JSON data: Handles ZIP extraction, text processing, keyword counting, and aggregation.
-    - Supports both JSON and ZIP formats.
+    Cleans [Source D] NYT JSON data: Reads JSON (or the JSON members of the ZIP in place), text processing, keyword counting, and aggregation.
+    - Supports JSON, gzipped JSON (*.json.gz, as written by get_data.py), Parquet (the recent-article table) and ZIP formats.
+    - Streams articles in batches and accumulates monthly counts, so memory stays O(months x keywords).
     - Outputs a DataFrame with monthly keyword counts and total counts.
     """
     print("\n[Cleaning] Source D: News Sentiment (Text Mining)...")
     
-    # Locate files (support both JSON and ZIP)
+    # Locate files (support JSON, gzipped JSON, Parquet and ZIP)
     json_pattern = os.path.join(RAW_DIR, 'source_d_*.json')
     zip_path = os.path.join(RAW_DIR, 'source_d_nyt_text_raw.zip')
     
-    json_files = glob.glob(json_pattern)
-    
-    # Auto-extract ZIP if JSON is missing
-    if not json_files:
-        if os.path.exists(zip_path):
-            print(f"  -> JSON not found, but ZIP exists. Extracting {zip_path}...")
-            with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                zip_ref.extractall(RAW_DIR)
-            print("  -> Extraction complete.")
-            json_files = glob.glob(json_pattern)
-        else:
-            print("  -> [Warning] Neither JSON nor ZIP file found for Source D.")
-            return pd.DataFrame()
-    
-    # Load all JSON chunks
-    all_articles = []
-    for filepath in json_files:
-        try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                if isinstance(data, list):
-                    all_articles.extend(data)
-        except Exception as e:
-            print(f"  -> Error reading {filepath}: {e}")
-            continue
-            
-    if not all_articles:
-        print("  -> [Warning] News data list is empty.")
+    json_files = glob.glob(json_pattern) + glob.glob(json_pattern + '.gz')
+    parquet_files = glob.glob(os.path.join(RAW_DIR, 'source_d_*.parquet'))
+    
+    # Stream all JSON chunks batch by batch, accumulating monthly counts
+    zip_ref = None
+    if json_files or parquet_files:
+        line_files = [fp for fp in json_files if not is_json_array(raw_opener(fp))]
+        batch_sources = [(fp, iter_news_array(raw_opener(fp)))
+                         for fp in json_files if fp not in line_files]
+        if line_files:
+            batch_sources.insert(0, (', '.join(line_files), iter_news_dataset(line_files)))
+        if parquet_files:
+            batch_sources.append((', '.join(parquet_files), iter_news_dataset(parquet_files, file_format='parquet')))
+    elif os.path.exists(zip_path):
+        # Read the JSON members straight out of the archive (no extraction to disk)
+        print(f"  -> JSON not found, but ZIP exists. Reading {zip_path} in place...")
+        zip_ref = zipfile.ZipFile(zip_path, 'r')
+        members = [n for n in zip_ref.namelist() if fnmatch.fnmatch(os.path.basename(n), 'source_d_*.json')]
+        batch_sources = []
+        for name in members:
+            open_member = functools.partial(zip_ref.open, name)
+            batches = iter_news_array(open_member) if is_json_array(open_member) else iter_news_lines(open_member)
+            batch_sources.append((f"{zip_path}:{name}", batches))
+    else:
+        print("  -> [Warning] Neither JSON nor ZIP file found for Source D.")
         return pd.DataFrame()
     
-    df = pd.DataFrame(all_articles)
-    
+    print(f"  -> Counting keywords: {NEWS_KEYWORDS}...")
+    df_monthly = pd.DataFrame()
+    raw_total_count = 0  # Counter for raw articles (every record read, in the analysis period or not)
+    try:
+        for source_name, batches in batch_sources:
+            try:
+                for n_read, batch in batches:
+                    raw_total_count += n_read
+                    batch_monthly = count_news_keywords(batch)
+                    if batch_monthly.empty:
+                        continue
+                    df_monthly = batch_monthly if df_monthly.empty else df_monthly.add(batch_monthly, fill_value=0)
+            except Exception as e:
+                print(f"  -> Error reading {source_name}: {e}")
+                continue
+    finally:
+        if zip_ref is not None:
+            zip_ref.close()
+            
     # Print Raw Dimensions
-    print(f"  [Data Check] Raw Dataset Dimensions: {df.shape[0]:,} rows, {len(df.columns)} columns")
+    print(f"  [Data Check] Raw Dataset Dimensions: {raw_total_count:,} rows, {len(NEWS_SCHEMA)} columns")
 
-    # Date Handling: Check 'pub_date' or 'date'
-    df['date'] = pd.to_datetime(df.get('date', df.get('pub_date')), errors='coerce')
-    
-    # Remove Timezone info for consistency
-    if df['date'].dt.tz is not None:
-        df['date'] = df['date'].dt.tz_localize(None)
-
-    df.dropna(subset=['date'], inplace=True)
-    
-    # Filter by analysis period
-    df = df[(df['date'] >= START_DATE) & (df['date'] <= END_DATE)]
-    
-    # Text Cleaning: Combine Headline + Snippet
-    df['full_text'] = (
-        df['headline'].fillna('') + " " + df['snippet'].fillna('')
-    ).str.lower()
-
-    # Keyword Counting
-    keywords = ['inflation', 'recession', 'crisis', 'high price', 'layoff', 'unemployment']
-    print(f"  -> Counting keywords: {keywords}...")
+    if df_monthly.empty:
+        print("  -> [Warning] News data list is empty.")
+        return pd.DataFrame()
     
-    for kw in keywords:
-        col_name = f"News_Count_{kw.title().replace(' ', '_')}"
-        df[col_name] = df['full_text'].str.contains(kw, case=False, regex=False).astype(int)
-
-    # Aggregation: Resample to Monthly Sum
-    df.set_index('date', inplace=True)
-    news_cols = [col for col in df.columns if 'News_' in col]
-    df_monthly = df[news_cols].resample('MS').sum()
+    # Batches may cover disjoint months: restore a gap-free monthly index with integer counts
+    df_monthly = df_monthly.sort_index().asfreq('MS', fill_value=0).astype('int64')
     
-    # Add Total Counting Column
-    df_monthly['News_Total_Counting'] = df_monthly.sum(axis=1)
+    # Monthly counts as the narrowest nullable integers that fit (nullable, so gaps survive the merge)
+    df_monthly = downcast_counts(df_monthly)
     
     # Save processed data
-    save_path = os.path.join(PROCESSED_DIR, 'clean_news_sentiment.csv')
-    df_monthly.to_csv(save_path)
+    save_path = os.path.join(PROCESSED_DIR, f'clean_news_sentiment.{PROCESSED_FMT}')
+    save_processed(df_monthly, save_path)
     
     print(f"  -> Saved cleaned Sentiment data to {save_path}")
     print(f"  -> Processed News Data Shape: {df_monthly.shape}")
@@ -388,10 +619,37 @@ def clean_news_data():
 # ==========================================
 # 5. Final Integration (Merge All)
 # ==========================================
+def load_or_clean(clean_func, processed_name):
+    """
+    Returns the cleaned output of a (memoized) cleaner, doing as little work as possible:
+    - In-memory result from an earlier call in this process if the raw inputs are unchanged.
+    - Otherwise the cached intermediate file if it is newer than all of the raw inputs.
+    - Otherwise runs clean_func(), which re-parses the raw files and rewrites the cache.
+    """
+    raw_patterns = clean_func.raw_patterns
+    memoized = memoized_result(clean_func.__name__, raw_patterns)
+    if memoized is not None:
+        print(f"\n[Memo] {processed_name}: raw inputs unchanged, reusing in-memory result")
+        return memoized
+
+    processed_path = os.path.join(PROCESSED_DIR, f"{processed_name}.{PROCESSED_FMT}")
+    signature = raw_mtimes(raw_patterns)
+
+    if os.path.exists(processed_path):
+        processed_mtime = os.path.getmtime(processed_path)
+        if all(processed_mtime > mtime for _, mtime in signature):
+            print(f"\n[Cache] {processed_name}: up to date, loading {processed_path}")
+            df = pd.read_parquet(processed_path)
+            CLEAN_CACHE[clean_func.__name__] = (signature, df.copy())
+            return df
+
+    return clean_func()
+
 def merge_all_data():
     """
     Integrates all cleaned datasets (CPI, Energy, Labor, News) into a single master CSV.
-    - Performs outer joins on Date index.
+    - Reuses cached Parquet outputs of sources whose raw files have not changed.
+    - Performs a single outer concat on the Date index, then one sort and one period filter.
     - Handles missing values via linear interpolation.
     - Saves final dataset to processed directory.
     """
@@ -399,42 +657,53 @@ def merge_all_data():
     print("[Merging] Integrating All Datasets...")
     print("="*50)
     
-    # Execute cleaning functions
-    df1 = clean_cpi_data()
-    df2 = clean_energy_data()
-    df3 = clean_labor_data()
-    df4 = clean_news_data()
-    
-    # Collect non-empty DataFrames
-    dfs_to_merge = [d for d in [df1, df2, df3, df4] if not d.empty]
-    
-    if not dfs_to_merge:
-        print("Error: No data available to merge.")
-        return
-
-    # Outer Join all datasets based on Date index
-    final_df = dfs_to_merge[0]
-    for df in dfs_to_merge[1:]:
-        final_df = final_df.join(df, how='outer')
-    
-    # Final Period Filtering
-    final_df = final_df[START_DATE:END_DATE]
-    
-    # Handling Missing Values (Linear Interpolation for time-series)
-    final_df.interpolate(method='linear', limit_direction='both', inplace=True)
+    # Queued intermediate writes are always awaited, also when there is nothing to merge
+    try:
+        # Execute cleaning functions (reusing cached outputs that are newer than their raw inputs)
+        df1 = load_or_clean(clean_cpi_data, 'clean_cpi')
+        df2 = load_or_clean(clean_energy_data, 'clean_energy')
+        df3 = load_or_clean(clean_labor_data, 'clean_unemployment')
+        df4 = load_or_clean(clean_news_data, 'clean_news_sentiment')
+    
+        # Collect non-empty DataFrames
+        dfs_to_merge = [d for d in [df1, df2, df3, df4] if d is not None and not d.empty]
+    
+        if not dfs_to_merge:
+            print("Error: No data available to merge.")
+            return
+
+        # Outer Join all datasets based on Date index (one index union, one allocation)
+        final_df = pd.concat(dfs_to_merge, axis=1, join='outer', sort=False)
     
-    # Save Final Dataset
-    save_path = os.path.join(PROCESSED_DIR, 'final_dataset.csv')
-    final_df.to_csv(save_path)
+        # Single sort + period filter for all sources (the cleaners return their full, unsorted history)
+        final_df = final_df.sort_index().loc[START_DATE:END_DATE]
     
-    print(f"\n[Success] Final Dataset Saved: {save_path}")
-    print(f" - Shape: {final_df.shape}")
-    print(f" - Time Range: {final_df.index.min().date()} to {final_df.index.max().date()}")
-    print("\n[Preview]")
-    print(final_df.tail())
+        # Handling Missing Values (Linear Interpolation for time-series)
+        # Only columns with gaps are interpolated, as float32
+        gap_cols = final_df.columns[final_df.isna().any()]
+        final_df[gap_cols] = final_df[gap_cols].astype('float32').interpolate(method='linear', limit_direction='both')
+        
+        # Gap-free news counts are written as integers (the outer concat turns them into float64 when the cache holds int64 and the history outruns the period)
+        if df4 is not None:
+            count_cols = [c for c in df4.columns if c in final_df.columns and c not in gap_cols]
+            final_df[count_cols] = downcast_counts(final_df[count_cols])
+    
+        # Save Final Dataset
+        save_path = os.path.join(PROCESSED_DIR, 'final_dataset.csv')
+        final_df.to_csv(save_path)
+    
+        print(f"\n[Success] Final Dataset Saved: {save_path}")
+        print(f" - Shape: {final_df.shape}")
+        print(f" - Time Range: {final_df.index.min().date()} to {final_df.index.max().date()}")
+        print("\n[Preview]")
+        print(final_df.tail())
+    finally:
+        # Make sure the intermediate caches are complete before anyone reads them
+        wait_for_writes()
 
 # ==========================================
 # Main Execution Flow
 # ==========================================
 if __name__ == "__main__":
-    merge_all_data()
\ No newline at end of file
+    merge_all_data()
+    IO_POOL.shutdown(wait=True)
\ No newline at end of file
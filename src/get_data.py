@@ -1,11 +1,19 @@
 import os
 import time
 import json
+import gzip
+import orjson
 import requests
+import requests_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import pandas as pd
-from bs4 import BeautifulSoup
-from io import StringIO
+from lxml import html
 import datetime
+import asyncio
+import aiohttp
+from aiohttp_client_cache import CachedSession, SQLiteBackend
+from aiohttp_client_cache.cache_control import DO_NOT_CACHE as AIOHTTP_DO_NOT_CACHE
 
 # ==========================================
 # [Setup] File Storage Path
@@ -18,6 +26,100 @@ DATA_RAW_DIR = os.path.join(BASE_DIR, 'data', 'raw')
 if not os.path.exists(DATA_RAW_DIR):
     os.makedirs(DATA_RAW_DIR)
 
+# ==========================================
+# [Setup] HTTP Retry Policy
+# ==========================================
+# Rate limits (429) and transient server errors are retried with exponential backoff (1s, 2s, 4s, ...),
+# honoring the server's Retry-After header when present
+RETRY_TOTAL = 7
+RETRY_BACKOFF_SEC = 1
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Seconds before a single request is abandoned (connect or read)
+REQUEST_TIMEOUT_SEC = 30
+
+def mount_retry_adapter(session):
+    """
+    Mounts the pooled, retrying HTTPAdapter (RETRY_* policy) on a requests session and returns it.
+    """
+    session.mount("https://", HTTPAdapter(
+        max_retries=Retry(
+            total=RETRY_TOTAL,
+            backoff_factor=RETRY_BACKOFF_SEC,
+            status_forcelist=RETRY_STATUSES,
+            respect_retry_after_header=True
+        ),
+        pool_connections=4,
+        pool_maxsize=32,
+        pool_block=False
+    ))
+    return session
+
+# One pooled session shared by the BLS/EIA fetchers: keep-alive reuses the TCP/TLS connection per host
+SESSION = mount_retry_adapter(requests.Session())
+
+# ==========================================
+# [Setup] NYT Response Cache
+# ==========================================
+# Published NYT articles do not change, so API responses are kept on disk (SQLite) and repeat runs over the
+# same months/windows are served locally, without a round-trip or a rate-limit pause.
+# The API key is left out of the cache key so that a new key still hits the existing cache.
+# Only periods that are over are cached: the current month (or a search window reaching today) is still growing.
+CACHE_DIR = os.path.join(BASE_DIR, '.cache')
+NYT_CACHE_EXPIRE = datetime.timedelta(days=30)
+
+def nyt_period_closed(period_end):
+    """
+    Returns True once an NYT period ending on period_end (a date) is over, i.e. its articles can no longer change.
+    """
+    return period_end < datetime.date.today()
+
+NYT_SESSION = mount_retry_adapter(requests_cache.CachedSession(
+    os.path.join(CACHE_DIR, 'nyt'),
+    backend='sqlite',
+    cache_control=True,
+    expire_after=NYT_CACHE_EXPIRE,
+    allowable_codes=(200,),
+    ignored_parameters=['api-key']
+))
+
+# ==========================================
+# [Setup] NYT Rate Limiter (Token Buckets)
+# ==========================================
+# NYT quotas are enforced with token buckets instead of a fixed pause after every call: a call only waits when a
+# bucket is empty, so time spent on the request itself counts toward the pacing. Sustained rate stays at one call
+# per NYT_REFILL_SEC (the old fixed 6s pause), with bursts of up to NYT_BURST calls; the daily cap is per run.
+NYT_BURST = 5
+NYT_REFILL_SEC = 6
+NYT_DAILY_LIMIT = 490
+
+NYT_RATE_BUCKETS = {
+    'burst': {'capacity': NYT_BURST, 'refill_sec': NYT_REFILL_SEC, 'tokens': NYT_BURST, 'updated': time.monotonic()},
+    'daily': {'capacity': NYT_DAILY_LIMIT, 'refill_sec': 86400 / NYT_DAILY_LIMIT, 'tokens': NYT_DAILY_LIMIT, 'updated': time.monotonic()}
+}
+
+def take_nyt_token():
+    """
+    Takes one call from every NYT_RATE_BUCKETS bucket (refilled for the time elapsed since the last call).
+    - Buckets may go negative, so concurrent callers queue up behind earlier reservations.
+    Returns: Seconds to wait before sending the call (0 while every bucket still holds a token).
+    """
+    now = time.monotonic()
+    wait_sec = 0.0
+    for bucket in NYT_RATE_BUCKETS.values():
+        bucket['tokens'] = min(bucket['capacity'], bucket['tokens'] + (now - bucket['updated']) / bucket['refill_sec'])
+        bucket['updated'] = now
+        bucket['tokens'] -= 1
+        wait_sec = max(wait_sec, -bucket['tokens'] * bucket['refill_sec'])
+    return wait_sec
+
+def return_nyt_token():
+    """
+    Gives back the token of a call that was answered from the local cache (it never reached the API).
+    """
+    for bucket in NYT_RATE_BUCKETS.values():
+        bucket['tokens'] = min(bucket['capacity'], bucket['tokens'] + 1)
+
 # ==========================================
 # Source A: Inflation Metrics (BLS API)
 # ==========================================
@@ -38,7 +140,7 @@ def get_source_a_inflation():
     })
     
     try:
-        response = requests.post('https://api.bls.gov/publicAPI/v2/timeseries/data/', data=payload, headers=headers)
+        response = SESSION.post('https://api.bls.gov/publicAPI/v2/timeseries/data/', data=payload, headers=headers, timeout=REQUEST_TIMEOUT_SEC)
         response.raise_for_status()
         
         save_path = os.path.join(DATA_RAW_DIR, 'source_a_cpi_detailed_raw.json')
@@ -49,7 +151,7 @@ def get_source_a_inflation():
         print(f" -> Error in Source A: {e}")
 
 # ======================================================
-# Source B: Energy Costs (Web Scraping - BeautifulSoup)
+# Source B: Energy Costs (Web Scraping - lxml XPath)
 # ======================================================
 def get_source_b_energy():
     """
@@ -72,28 +174,25 @@ def get_source_b_energy():
     for name, url in energy_urls.items():
         print(f" -> Fetching {name}...", end=" ")
         try:
-            response = requests.get(url, headers=headers)
-            soup = BeautifulSoup(response.content, "html.parser")
+            response = SESSION.get(url, headers=headers, timeout=REQUEST_TIMEOUT_SEC)
+            tree = html.fromstring(response.content)
             
             # Find data table
-            all_tables = soup.find_all("table")
+            all_tables = tree.xpath("//table")
             if not all_tables:
                 print("No tables found.")
                 continue
                 
             # The table with the most rows is the data table
-            target_table = max(all_tables, key=lambda t: len(t.find_all("tr")))
-            rows = target_table.find_all("tr")
+            target_table = max(all_tables, key=lambda t: len(t.xpath(".//tr")))
+            rows = target_table.xpath(".//tr")
             
             # Save all cell text as-is (Raw List of Lists)
             raw_table_data = []
             for row in rows:
-                cols = row.find_all("td")
-                if not cols: continue # Skip header rows
-                
-                # Convert cell text to list (remove whitespace)
+                # Convert cell text to list (remove whitespace); header rows have no <td> and yield nothing
                 # Example: ['Oct-2023', '10/02', '3.801', '10/09', '3.750', ...]
-                col_texts = [c.text.strip() for c in cols if c.text.strip()]
+                col_texts = [text for text in (c.text_content().strip() for c in row.xpath(".//td")) if text]
                 
                 if col_texts:
                     raw_table_data.append(col_texts)
@@ -113,7 +212,7 @@ def get_source_b_energy():
             print(f"Error: {e}")
 
 # ==========================================================
-# Source C: Labor Market (Web Scraping - BeautifulSoup Fixed)
+# Source C: Labor Market (Web Scraping - lxml XPath)
 # ==========================================================
 def get_source_c_labor():
     """
@@ -132,39 +231,40 @@ def get_source_c_labor():
     for category, url in urls.items():
         try:
             print(f" -> Scraping {category} Unemployment...", end=" ")
-            response = requests.get(url, headers=headers)
+            response = SESSION.get(url, headers=headers, timeout=REQUEST_TIMEOUT_SEC)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, "html.parser")
+            tree = html.fromstring(response.content)
             
             # Find the correct table (contains 'Year' and 'Jan')
             target_table = None
-            all_tables = soup.find_all("table")
+            all_tables = tree.xpath("//table")
             
             for table in all_tables:
                 # Check just the first row or thead for headers
-                first_row = table.find("tr")
-                if not first_row: continue
+                first_rows = table.xpath("(.//tr)[1]")
+                if not first_rows: continue
                 
                 # Extract text from first row to check signature
-                first_row_text = [c.get_text().strip().lower() for c in first_row.find_all(["th", "td"])]
+                first_row_text = [c.text_content().strip().lower() for c in first_rows[0].xpath(".//th | .//td")]
                 
                 if 'year' in first_row_text and 'jan' in first_row_text:
                     target_table = table
                     break
             
-            if target_table:
+            if target_table is not None:
+                all_rows = target_table.xpath(".//tr")
+                
                 # 1. Parse Headers (Only from the first row)
                 # Use the first row found above
-                headers_row = target_table.find("tr")
-                headers_list = [c.get_text().strip() for c in headers_row.find_all(["th", "td"]) if c.get_text().strip()]
+                headers_row = all_rows[0]
+                headers_list = [text for text in (c.text_content().strip() for c in headers_row.xpath(".//th | .//td")) if text]
                 
                 # 2. Parse Rows
                 rows_data = []
                 # Skip the first row (headers) and iterate the rest
-                for tr in target_table.find_all("tr")[1:]:
-                    cells = tr.find_all(["td", "th"])
-                    row_text = [cell.get_text().strip() for cell in cells]
+                for tr in all_rows[1:]:
+                    row_text = [cell.text_content().strip() for cell in tr.xpath(".//td | .//th")]
                     
                     # Validate row:
                     # - First column must look like a year (start with 4 digits)
@@ -201,6 +301,25 @@ def get_source_c_labor():
 # ==========================================
 # Source D: Public Sentiment (NYT API)
 # ==========================================
+# Raw NYT dumps are machine-read only: compact JSON Lines, gzip-compressed (level 3 favors write speed)
+NYT_GZIP_LEVEL = 3
+
+def finish_jsonl(part_path, save_path, n_written):
+    """
+    Moves a fully streamed, gzipped JSON Lines file (part_path) into place at save_path (*.json.gz).
+    - Removes the uncompressed *.json left by earlier runs, so clean_data.py does not count it twice.
+    - If nothing was written, the partial file is discarded and any previous save_path is kept.
+    Returns: True if save_path was replaced.
+    """
+    if n_written:
+        os.replace(part_path, save_path)
+        legacy_path = save_path[:-len('.gz')]
+        if os.path.exists(legacy_path):
+            os.remove(legacy_path)
+        return True
+    os.remove(part_path)
+    return False
+
 def get_source_d_sentiment(api_key):
     """
     [Source D] NYT API: Collect Raw Text
@@ -213,7 +332,10 @@ def get_source_d_sentiment(api_key):
         return
 
     base_url = "https://api.nytimes.com/svc/archive/v1/{}/{}.json"
-    all_articles = []
+    save_path = os.path.join(DATA_RAW_DIR, 'source_d_nyt_text_raw.json.gz')
+    part_path = save_path + '.part'
+    n_written = 0
+    stop = False
     
     headers = {"User-Agent": "Mozilla/5.0"}
 
@@ -221,160 +343,251 @@ def get_source_d_sentiment(api_key):
     current_year = now.year
     current_month = now.month
 
-    for year in range(2016, current_year + 1):
-        for month in range(1, 13):
-            if year > current_year or (year == current_year and month > current_month):
-                print(f" -> Reached future date ({year}-{month:02d}). Stopping.")
-                return # Stop entire function if future reached
+    # Articles are streamed to disk month by month as gzipped JSON Lines; only the running count is kept in memory
+    # The final save runs in any case, so the months streamed before an unexpected error are kept
+    try:
+        with gzip.open(part_path, 'wb', compresslevel=NYT_GZIP_LEVEL) as f:
+            for year in range(2016, current_year + 1):
+                for month in range(1, 13):
+                    if year > current_year or (year == current_year and month > current_month):
+                        print(f" -> Reached future date ({year}-{month:02d}). Stopping.")
+                        stop = True
+                        break # Stop entire collection if future reached
 
-            # Keep trying the CURRENT month until success or fatal error
-            while True:
-                print(f" -> Fetching {year}-{month:02d}...", end=" ")
+                    print(f" -> Fetching {year}-{month:02d}...", end=" ")
                 
-                url = base_url.format(year, month)
-                params = {'api-key': api_key}
+                    url = base_url.format(year, month)
+                    params = {'api-key': api_key}
+                    
+                    # The running month is fetched fresh (neither read from nor written to the cache)
+                    month_end = datetime.date(year + month // 12, month % 12 + 1, 1) - datetime.timedelta(days=1)
+                    expire_after = NYT_CACHE_EXPIRE if nyt_period_closed(month_end) else requests_cache.DO_NOT_CACHE
                 
-                try:
-                    resp = requests.get(url, params=params, headers=headers)
+                    # Quota pacing via the token buckets; rate limits and transient errors are retried with backoff inside NYT_SESSION
+                    try:
+                        time.sleep(take_nyt_token())
+                        resp = NYT_SESSION.get(url, params=params, headers=headers, timeout=REQUEST_TIMEOUT_SEC,
+                                               expire_after=expire_after)
+                        if resp.from_cache:
+                            return_nyt_token()
                     
-                    if resp.status_code == 200:
-                        data = resp.json()
-                        docs = data.get('response', {}).get('docs', [])
-                        for doc in docs:
-                            all_articles.append({
+                        if resp.status_code == 200:
+                            data = resp.json()
+                            docs = data.get('response', {}).get('docs', [])
+                            # A month is encoded in full before it is written, so a malformed doc never leaves half a month behind
+                            lines = b"".join(orjson.dumps({
                                 "date": doc.get("pub_date"),
-                                "headline": doc.get("headline", {}).get("main"),
+                                "headline": (doc.get("headline") or {}).get("main"),
                                 "snippet": doc.get("snippet"),
                                 "lead_paragraph": doc.get("lead_paragraph")
-                            })
-                        print(f"OK ({len(docs)} docs)")
-                        time.sleep(6) 
-                        break # Success: Exit while loop, move to next month
-                        
-                    elif resp.status_code == 429:
-                        print("\n    [Wait] Rate limit hit. Sleeping 30s...", end=" ")
-                        time.sleep(30)
-                        print("Retrying...")
-                        continue # Retry the SAME month
+                            }) + b"\n" for doc in docs)
+                            f.write(lines)
+                            n_written += len(docs)
+                            if resp.from_cache:
+                                print(f"OK ({len(docs)} docs, cached)")
+                            else:
+                                print(f"OK ({len(docs)} docs)")
                         
-                    elif resp.status_code == 403:
-                        print(f"\n    [Stop] 403 Forbidden. Assuming end of archive.")
-                        # Save what I have and exit
-                        if all_articles:
-                            save_path = os.path.join(DATA_RAW_DIR, 'source_d_nyt_text_raw.json')
-                            with open(save_path, 'w', encoding='utf-8') as f:
-                                json.dump(all_articles, f, indent=4)
-                            print(f" -> Saved {len(all_articles)} articles.")
-                        return # Exit function completely
+                        elif resp.status_code == 403:
+                            print(f"\n    [Stop] 403 Forbidden. Assuming end of archive.")
+                            stop = True
+                            break # Save what I have and exit
                         
-                    else:
-                        print(f"Failed ({resp.status_code})")
-                        break # Skip this month on unknown error
+                        else:
+                            print(f"Failed ({resp.status_code})") # Skip this month on unknown error
                 
-                except Exception as e:
-                    print(f"Error: {e}")
-                    time.sleep(5)
-                    break # Skip month on connection error
-
-    # Final Save
-    if all_articles:
-        save_path = os.path.join(DATA_RAW_DIR, 'source_d_nyt_text_raw.json')
-        with open(save_path, 'w', encoding='utf-8') as f:
-            json.dump(all_articles, f, indent=4)
-        print(f"\n -> Saved {len(all_articles)} raw articles to: {save_path}")
+                    except (requests.RequestException, ValueError, AttributeError) as e:
+                        print(f"Error: {e}") # Skip month once retries are exhausted, on connection error or on a malformed response
+            
+                if stop:
+                    break
+    finally:
+        # Final Save
+        if finish_jsonl(part_path, save_path, n_written):
+            print(f"\n -> Saved {n_written} raw articles to: {save_path}")
 
 # ==========================================
 # [Source D - Extension] Recent Data
 # ==========================================
-def get_source_d_sentiment_recent(api_key, start_str="20250601", end_str="20251201"):
+# Concurrency limit for the Article Search API (in-flight requests); pacing comes from the NYT token buckets
+NYT_CONCURRENCY = 5
+
+# Article Search returns at most this many docs per page
+NYT_PAGE_SIZE = 10
+
+# Columns of the recent-article table (one tuple per article while collecting, one DataFrame at save time)
+NYT_RECENT_COLUMNS = ['date', 'headline', 'snippet', 'lead_paragraph', 'section_name']
+
+async def fetch_recent_page(session, sem, base_url, params, expire_after=None):
+    """
+    Fetches one (batch, page) of the NYT Article Search API.
+    - Holds a semaphore slot while waiting for an NYT token and for the request (cached responses return the token).
+    - expire_after: Per-request cache lifetime (AIOHTTP_DO_NOT_CACHE bypasses the cache); session default if None.
+    - Retries 429/5xx with the RETRY_* backoff policy (Retry-After wins when sent); returns None once exhausted.
+    Returns: The 'response' object ('docs' and 'meta') or None.
+    """
+    async with sem:
+        for attempt in range(RETRY_TOTAL + 1):
+            try:
+                await asyncio.sleep(take_nyt_token())
+                async with session.get(base_url, params=params, expire_after=expire_after) as resp:
+                    if resp.from_cache:
+                        return_nyt_token()
+                    if resp.status == 200:
+                        data = await resp.json()
+                        return data.get('response', {})
+
+                    if resp.status not in RETRY_STATUSES or attempt == RETRY_TOTAL:
+                        print(f" [Err {resp.status}] ", end="")
+                        return None
+
+                    retry_after = resp.headers.get('Retry-After', '')
+                    wait_sec = float(retry_after) if retry_after.isdigit() else RETRY_BACKOFF_SEC * 2 ** attempt
+                    print(f" [{resp.status}: Retry in {wait_sec:g}s]", end="")
+
+            except Exception as e:
+                print(f" [Ex: {e}] ", end="")
+                return None
+
+            await asyncio.sleep(wait_sec)
+
+async def fetch_recent_window(session, sem, base_url, params, max_pages, expire_after=None):
+    """
+    Fetches the pages of one 30-day window: page 0 first, then (concurrently) only the pages that can hold articles.
+    - expire_after: Cache lifetime for every page of the window (see fetch_recent_page).
+    - A short page 0 (fewer than NYT_PAGE_SIZE docs) ends the window; otherwise meta.hits caps the page count.
+    - If page 0 fails, the hit count is unknown and all max_pages pages are tried.
+    Returns: List of docs lists (None for a failed page), one per requested page, in page order.
+    """
+    def page_docs(result):
+        return None if result is None or isinstance(result, BaseException) else result.get('docs', [])
+
+    first = await fetch_recent_page(session, sem, base_url, {**params, 'page': 0}, expire_after)
+    docs = page_docs(first)
+    
+    n_pages = max_pages
+    if docs is not None:
+        hits = first.get('meta', {}).get('hits')
+        if len(docs) < NYT_PAGE_SIZE:
+            n_pages = 1
+        elif hits is not None:
+            n_pages = min(max_pages, -(-hits // NYT_PAGE_SIZE))
+    
+    rest = await asyncio.gather(*[
+        fetch_recent_page(session, sem, base_url, {**params, 'page': page}, expire_after)
+        for page in range(1, n_pages)
+    ], return_exceptions=True)
+    return [docs] + [page_docs(result) for result in rest]
+
+async def get_source_d_sentiment_recent(api_key, start_str="20250601", end_str="20251201"):
     """
     [Source D - Extension] NYT API: Recent Data Collection
-    - Strategy: 3-Day Batch + Pagination (Top 20 articles).
+    - Strategy: 30-Day Batch + Pagination (Top 50 articles), so a month costs at most 5 calls instead of ~20.
     - Mode: Raw Mode (No filters) to ensure data retrieval.
+    - Windows are fetched concurrently (bounded by NYT_CONCURRENCY); pages past a window's last hit are skipped.
+    - Run via asyncio.run().
     """
-    print(f"\n[Source D-Extension] Fetching Recent Data ({start_str}-{end_str}) [Top 20/Batch]...")
+    BATCH_SIZE = 30
+    MAX_PAGES = 5  # Fetch Pages 0-4 (Total 50 articles per batch)
+
+    print(f"\n[Source D-Extension] Fetching Recent Data ({start_str}-{end_str}) [Top {MAX_PAGES * 10}/Batch]...")
     
     base_url = "https://api.nytimes.com/svc/search/v2/articlesearch.json"
     headers = {"User-Agent": "Mozilla/5.0"}
-    all_articles = []
 
     start_date = datetime.datetime.strptime(start_str, "%Y%m%d")
     end_date = datetime.datetime.strptime(end_str, "%Y%m%d")
     
     current_date = start_date
-    BATCH_SIZE = 3 
-    MAX_PAGES = 2  # Fetch Page 0 and Page 1 (Total 20 articles per batch)
 
+    # 1. Enumerate every 30-day window up front, with its cache lifetime (windows that have not ended are not cached)
+    windows = []
     while current_date <= end_date:
-        # Define 3-day window
+        # Define 30-day window
         batch_end = current_date + datetime.timedelta(days=BATCH_SIZE - 1)
         if batch_end > end_date:
             batch_end = end_date
             
         d_start = current_date.strftime("%Y%m%d")
         d_end = batch_end.strftime("%Y%m%d")
+        expire_after = NYT_CACHE_EXPIRE if nyt_period_closed(batch_end.date()) else AIOHTTP_DO_NOT_CACHE
+        windows.append((d_start, d_end, expire_after))
         
-        print(f" -> Fetching {d_start}~{d_end}...", end=" ")
-        
-        # Loop through pages (0, 1)
-        for page in range(MAX_PAGES): 
-            # Retry Loop: Keep trying this specific page if Rate Limited
-            while True:
-                params = {
-                    'api-key': api_key,
-                    'begin_date': d_start,
-                    'end_date': d_end,
-                    'page': page,
-                    'sort': 'relevance' # No 'q' or 'fq' filters to guarantee data retrieval
-                }
-                
-                try:
-                    resp = requests.get(base_url, params=params, headers=headers)
-                    
-                    if resp.status_code == 200:
-                        data = resp.json()
-                        docs = data.get('response', {}).get('docs', [])
-                        
-                        if docs:
-                            for doc in docs:
-                                all_articles.append({
-                                    "date": doc.get("pub_date"),
-                                    "headline": doc.get("headline", {}).get("main"),
-                                    "snippet": doc.get("snippet"),
-                                    "lead_paragraph": doc.get("lead_paragraph"),
-                                    "section_name": doc.get("section_name") # Saved for filtering later
-                                })
-                            print(f"[P{page}: {len(docs)}]", end=" ")
-                        else:
-                            print(f"[P{page}: Empty]", end=" ")
-                        
-                        time.sleep(6)
-                        break 
-                        
-                    elif resp.status_code == 429:
-                        print(" [Rate Limit! Wait 30s...]", end="")
-                        time.sleep(30)
-                        continue 
-                    
-                    else:
-                        print(f" [Err {resp.status_code}] ", end="")
-                        # For other errors (400, 500), break retry to avoid infinite loop
-                        break
-                        
-                except Exception as e:
-                    print(f" [Ex: {e}] ", end="")
-                    time.sleep(5)
-                    break # Break retry on connection error
-        
-        print("Done.")
         current_date += datetime.timedelta(days=BATCH_SIZE)
 
-    # Final Save
-    if all_articles:
-        save_path = os.path.join(DATA_RAW_DIR, 'source_d_nyt_recent_raw.json')
-        with open(save_path, 'w', encoding='utf-8') as f:
-            json.dump(all_articles, f, indent=4)
-        print(f"\n -> Saved {len(all_articles)} articles to: {save_path}")
+    # 2. Fetch all windows concurrently over one pooled session (closed windows fetched in earlier runs come from the cache,
+    #    a window that has not ended yet is always fetched fresh)
+    sem = asyncio.Semaphore(NYT_CONCURRENCY)
+    connector = aiohttp.TCPConnector(limit_per_host=NYT_CONCURRENCY)
+    timeout = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT_SEC)
+    cache = SQLiteBackend(
+        os.path.join(CACHE_DIR, 'nyt_recent'),
+        expire_after=NYT_CACHE_EXPIRE,
+        allowed_codes=(200,),
+        ignored_params=['api-key'],
+        cache_control=True
+    )
+    async with CachedSession(cache=cache, headers=headers, connector=connector, timeout=timeout) as session:
+        tasks = [
+            fetch_recent_window(session, sem, base_url, {
+                'api-key': api_key,
+                'begin_date': d_start,
+                'end_date': d_end,
+                'sort': 'relevance' # No 'q' or 'fq' filters to guarantee data retrieval
+            }, MAX_PAGES, expire_after)
+            for d_start, d_end, expire_after in windows
+        ]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    # 3. Collect results as plain tuples (NYT_RECENT_COLUMNS) in window/page order (gather preserves it) and report per batch
+    articles = []
+
+    print()
+    for (d_start, d_end, _), pages in zip(windows, results):
+        print(f" -> Fetched {d_start}~{d_end}...", end=" ")
+        window_failed = isinstance(pages, BaseException)
+        if window_failed:
+            pages = [None]
+
+        for page, docs in enumerate(pages):
+            if docs is None:
+                print(f"[P{page}: Failed]", end=" ")
+            elif docs:
+                articles.extend(
+                    (
+                        doc.get("pub_date"),
+                        (doc.get("headline") or {}).get("main"),
+                        doc.get("snippet"),
+                        doc.get("lead_paragraph"),
+                        doc.get("section_name") # Saved for filtering later
+                    )
+                    for doc in docs
+                )
+                print(f"[P{page}: {len(docs)}]", end=" ")
+            else:
+                print(f"[P{page}: Empty]", end=" ")
+
+        # Pages past the hit count were never requested (not shown when the whole window failed)
+        if not window_failed and len(pages) < MAX_PAGES:
+            skipped = f"P{len(pages)}" if len(pages) == MAX_PAGES - 1 else f"P{len(pages)}-{MAX_PAGES - 1}"
+            print(f"[{skipped}: Skipped]", end=" ")
+        print("Done.")
+
+    # Final Save: one typed table written as zstd-compressed Parquet (section_name repeats a handful of values -> category)
+    save_path = os.path.join(DATA_RAW_DIR, 'source_d_nyt_recent_raw.parquet')
+    if articles:
+        df = pd.DataFrame(articles, columns=NYT_RECENT_COLUMNS)
+        df['section_name'] = df['section_name'].astype('category')
+        
+        part_path = save_path + '.part'
+        df.to_parquet(part_path, compression='zstd', index=False)
+        os.replace(part_path, save_path)
+        
+        # Drop the JSON dumps of earlier runs, so clean_data.py does not count the same articles twice
+        for legacy_path in (save_path.replace('.parquet', '.json'), save_path.replace('.parquet', '.json.gz')):
+            if os.path.exists(legacy_path):
+                os.remove(legacy_path)
+        print(f"\n -> Saved {len(df)} articles to: {save_path}")
     else:
         print("\n -> No articles collected.")
 
@@ -398,6 +611,6 @@ if __name__ == "__main__":
     
     # 4. News Text (Original Text)
     get_source_d_sentiment(MY_NYT_KEY)
-    get_source_d_sentiment_recent(MY_NYT_KEY)
+    asyncio.run(get_source_d_sentiment_recent(MY_NYT_KEY))
     
     print("\n=== Data Collection Complete ===")
\ No newline at end of file
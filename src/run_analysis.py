@@ -1,15 +1,71 @@
 import pandas as pd
 import numpy as np
 import os
+import json
+import functools
+import pyarrow as pa
+import pyarrow.parquet as pq
 from scipy import stats
+from numba import njit, prange
 
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 PROCESSED_DIR = os.path.join(BASE_DIR, 'data', 'processed')
 
-def load_data():
+# Columns used by the analyses below (run_analysis loads only these; the plots load every column)
+NUMERIC_COLS = [
+    'Gas_Price', 'Diesel_Price', 'Oil_Price',
+    'CPI_Total_YoY', 'CPI_Food_YoY', 'CPI_Energy_YoY', 'CPI_Shelter_YoY',
+    'Unemp_Total', 'Unemp_Men', 'Unemp_Women',
+    'News_Total_Counting', 'News_Count_Recession', 'News_Count_Layoff', 'News_Count_Crisis', 'News_Count_Unemployment'
+]
+
+# Schema metadata key holding the dtypes the Parquet mirror was written with
+MIRROR_DTYPES_KEY = b'final_dataset_dtypes'
+
+def to_parquet_once(csv_path):
+    """
+    Mirrors final_dataset.csv as final_dataset.parquet (typed, columnar) when the CSV is newer or the dtype map changed.
+    - Every column is kept at the CSV's precision (the plots print values as-is); NUMERIC_COLS are read as float64 (not float32) and the date with a fixed format (no type or format inference).
+    - No columns are dropped here; load_data() narrows to the requested columns when reading the Parquet copy.
+    - The dtype map is stored in the Parquet schema metadata, so editing NUMERIC_COLS also rewrites the mirror.
+    Returns: Path of the Parquet copy.
+    """
+    parquet_path = os.path.splitext(csv_path)[0] + '.parquet'
+    dtypes = {c: 'float64' for c in NUMERIC_COLS}
+    signature = json.dumps(dtypes).encode()
+    
+    if (
+        not os.path.exists(parquet_path)
+        or os.path.getmtime(parquet_path) < os.path.getmtime(csv_path)
+        or (pq.read_schema(parquet_path).metadata or {}).get(MIRROR_DTYPES_KEY) != signature
+    ):
+        df = pd.read_csv(
+            csv_path,
+            dtype=dtypes,
+            engine='c',
+            index_col='date',
+            parse_dates=['date'],
+            date_format='%Y-%m-%d'
+        )
+        table = pa.Table.from_pandas(df)
+        table = table.replace_schema_metadata({**table.schema.metadata, MIRROR_DTYPES_KEY: signature})
+        pq.write_table(table, parquet_path)
+    return parquet_path
+
+@functools.lru_cache(maxsize=1)
+def read_final_dataset(parquet_path, mtime, columns=None):
+    """
+    Reads the Parquet copy of the final dataset; memoized per (path, mtime, columns), so a rewritten file is re-read.
+    - columns: Tuple of columns to read (only those are decoded), or None for all of them.
+    """
+    return pd.read_parquet(parquet_path, columns=list(columns) if columns is not None else None)
+
+def load_data(columns=None):
     """
     Load the final merged dataset (final_dataset.csv).
-    Returns: DataFrame or None if file not found.
+    - columns: Columns to keep (e.g. NUMERIC_COLS for the analyses); None keeps all of them (the plots need the CPI levels and news counts too).
+    - Repeated calls in the same process are served from memory (read_final_dataset).
+    Returns: DataFrame (a copy, safe to modify) or None if file not found.
     """
     file_path = os.path.join(PROCESSED_DIR, 'final_dataset.csv')
     if not os.path.exists(file_path):
@@ -18,14 +74,128 @@ def load_data():
         return None
     
     print(f"Loading data from: {file_path}")
-    return pd.read_csv(file_path, index_col='date', parse_dates=True)
+    parquet_path = to_parquet_once(file_path)
+    columns = tuple(columns) if columns is not None else None
+    return read_final_dataset(parquet_path, os.path.getmtime(parquet_path), columns).copy()
+
+# ==========================================
+# [Helper] Column Arrays
+# ==========================================
+def column_arrays(df):
+    """
+    Converts the analysed columns to plain float64 NumPy arrays once (the analyses only read them).
+    Returns: {column: ndarray}, aligned with df.index.
+    """
+    return {c: df[c].to_numpy(dtype=np.float64) for c in NUMERIC_COLS if c in df.columns}
+
+def pairwise_corr(x, y):
+    """
+    Pearson correlation of two aligned arrays over the rows where both are finite (as Series.corr does).
+    """
+    valid = np.isfinite(x) & np.isfinite(y)
+    if valid.sum() < 2:
+        return np.nan
+    return np.corrcoef(x[valid], y[valid])[0, 1]
+
+# ==========================================
+# [Helper] Pre/Post COVID Split
+# ==========================================
+# First month of the post-COVID regime
+COVID_SPLIT_DATE = pd.Timestamp('2020-01-01')
+
+def split_regimes(df):
+    """
+    Splits a date-sorted DataFrame into (pre_covid, post_covid) at COVID_SPLIT_DATE.
+    - One binary search on the index, then positional slices (no per-slice date-string parsing).
+    """
+    split = df.index.searchsorted(COVID_SPLIT_DATE)
+    return df.iloc[:split], df.iloc[split:]
+
+# ==========================================
+# [Helper] Lag Correlation
+# ==========================================
+@njit(parallel=True, cache=True, error_model='numpy')
+def lag_corr_kernel(X, pairs, max_lag):
+    """
+    Corr(X[t, i], X[t + lag, j]) for every (i, j) row of pairs and every lag in 0..max_lag (compiled by Numba).
+    - Pairwise-complete observations per lag, as pandas does: rows where either value is NaN are skipped.
+    - Two passes per (pair, lag): means of the valid rows, then centred sums (no cancellation from raw sums).
+    Returns: float64 array of shape (len(pairs), max_lag + 1); NaN where fewer than 2 rows overlap or either side is constant (as Series.corr).
+    """
+    n = X.shape[0]
+    out = np.full((pairs.shape[0], max_lag + 1), np.nan)
+    for p in prange(pairs.shape[0]):
+        i, j = pairs[p, 0], pairs[p, 1]
+        for lag in range(max_lag + 1):
+            count = 0
+            sum_x = 0.0
+            sum_y = 0.0
+            for t in range(n - lag):
+                x, y = X[t, i], X[t + lag, j]
+                if not (np.isnan(x) or np.isnan(y)):
+                    count += 1
+                    sum_x += x
+                    sum_y += y
+            if count < 2:
+                continue
+
+            mean_x, mean_y = sum_x / count, sum_y / count
+            sxy = 0.0
+            sxx = 0.0
+            syy = 0.0
+            for t in range(n - lag):
+                x, y = X[t, i], X[t + lag, j]
+                if not (np.isnan(x) or np.isnan(y)):
+                    dx, dy = x - mean_x, y - mean_y
+                    sxy += dx * dy
+                    sxx += dx * dx
+                    syy += dy * dy
+            if sxx == 0.0 or syy == 0.0:
+                continue  # Zero variance: correlation undefined, stays NaN (max/min would turn NaN into -1.0)
+            out[p, lag] = min(1.0, max(-1.0, sxy / np.sqrt(sxx * syy)))
+    return out
+
+def lag_correlation_table(df, pairs, max_lag=6):
+    """
+    Corr(Leader_t, Follower_t+lag), i.e. leader.corr(follower.shift(-lag)), for each (leader, follower) pair.
+    - The columns involved are copied into one float64 array once; all pairs and lags come from a single kernel call.
+    Returns: float64 array of shape (len(pairs), max_lag + 1), one row per pair.
+    """
+    cols = list(dict.fromkeys(c for pair in pairs for c in pair))
+    X = df[cols].to_numpy(dtype=np.float64)
+    pair_idx = np.array([[cols.index(leader), cols.index(follower)] for leader, follower in pairs], dtype=np.int64)
+    return lag_corr_kernel(X, pair_idx.reshape(-1, 2), max_lag)
+
+# (leader, follower) pairs read by Analysis 2 (supply chain), Analysis 3 (labor trade-off) and Analysis 6 (causal chain)
+SUPPLY_CHAIN_PAIR = ('Diesel_Price', 'CPI_Food_YoY')
+LABOR_TRADEOFF_PAIR = ('Unemp_Total', 'CPI_Total_YoY')
+CAUSAL_CHAINS = [
+    ("Energy -> Inflation", "Gas_Price", "CPI_Total_YoY"),
+    ("Inflation -> Labor", "CPI_Total_YoY", "Unemp_Total"),
+    ("Labor -> News Fear", "Unemp_Total", "News_Total_Counting")
+]
+
+def precompute_correlations(df, max_lag=6, pairs=None):
+    """
+    Computes the lag correlations shared by Analyses 2, 3 and 6 with a single lag_correlation_table call.
+    Returns: {(leader, follower): float64 array of Corr(Leader_t, Follower_t+lag) for lag 0..max_lag}
+    - pairs: (leader, follower) pairs to compute; defaults to every pair used by Analyses 2, 3 and 6.
+    - Pairs with a column missing from df are left out.
+    """
+    if pairs is None:
+        pairs = [SUPPLY_CHAIN_PAIR, LABOR_TRADEOFF_PAIR] + [(leader, follower) for _, leader, follower in CAUSAL_CHAINS]
+    pairs = [pair for pair in dict.fromkeys(pairs) if pair[0] in df.columns and pair[1] in df.columns]
+    if not pairs:
+        return {}
+    return dict(zip(pairs, lag_correlation_table(df, pairs, max_lag)))
 
 # ==========================================
 # [Analysis 1] Basic & Advanced Statistics
 # ==========================================
-def analyze_basic_stats(df):
+def analyze_basic_stats(df, cols=None):
     """
     Generate descriptive statistics including advanced metrics (Skewness, CV(Coefficient of Variation)).
+    - cols: Column arrays from column_arrays(); converted here if not given.
     """
     print("\n" + "="*80)
     print("[1. Basic & Advanced Statistics] Comprehensive Overview")
@@ -38,21 +208,31 @@ def analyze_basic_stats(df):
         'Unemp_Total', 'Unemp_Men', 'Unemp_Women',
         'News_Total_Counting', 'News_Count_Recession', 'News_Count_Layoff', 'News_Count_Crisis', 'News_Count_HighPrice', 'News_Count_Unemployment'
     ]
-    cols = [c for c in target_cols if c in df.columns]
+    if cols is None:
+        cols = column_arrays(df)
+    names = [c for c in target_cols if c in cols]
     
-    if not cols:
+    if not names:
         print("No target columns found in the dataset.")
         return
 
-    # Basic stats
-    stats_df = df[cols].describe().T
+    # Basic stats: one float64 array, reduced column-wise (NaN-aware, sample std and bias-corrected skew as in pandas)
+    arr = np.column_stack([cols[c] for c in names])
+    mean = np.nanmean(arr, axis=0)
+    std = np.nanstd(arr, axis=0, ddof=1)
     
-    # Advanced metrics
-    stats_df['skew'] = df[cols].skew()
-    stats_df['Volatility (CV)'] = stats_df['std'] / stats_df['mean']
+    stats_df = pd.DataFrame({
+        'mean': mean,
+        'median': np.nanmedian(arr, axis=0),
+        'min': np.nanmin(arr, axis=0),
+        'max': np.nanmax(arr, axis=0),
+        'std': std,
+        # Advanced metrics
+        'skew': np.ma.filled(stats.skew(arr, axis=0, bias=False, nan_policy='omit'), np.nan),
+        'Volatility (CV)': std / mean
+    }, index=names)
     
     # Formatting
-    stats_df.rename(columns={'50%': 'median'}, inplace=True)
     display_cols = ['mean', 'median', 'min', 'max', 'std', 'skew', 'Volatility (CV)']
     
     print(stats_df[display_cols].round(3))
@@ -61,42 +241,49 @@ def analyze_basic_stats(df):
 # ===================================================================================
 # [Analysis 2] Sector Impact (Supply Chain: Energy(Diesel) - Inflation(Food Prices))
 # ===================================================================================
-def analyze_supply_chain_impact(df):
+def analyze_supply_chain_impact(df, corrs=None):
     """
     Analyze correlation and lag effects between Diesel Prices and Food CPI.
+    - corrs: Lag correlations from precompute_correlations(); without it, only these two columns are correlated.
     """
     print("\n" + "="*80)
     print("[2. Supply Chain Analysis] Diesel Cost vs Food Prices")
     print("="*80)
     
     if 'Diesel_Price' in df.columns and 'CPI_Food_YoY' in df.columns:
-        corr = df['Diesel_Price'].corr(df['CPI_Food_YoY'])
-        print(f"Correlation (Diesel Price <-> Food CPI YoY): {corr:.4f}")
+        lags = [0, 1, 2, 3]
+        
+        # Leader(t) vs Follower(t+lag), i.e. Diesel_t vs Food_t+lag (equivalently Diesel.shift(lag) vs Food)
+        if corrs is not None:
+            lag_corrs = corrs[SUPPLY_CHAIN_PAIR][lags]
+        else:
+            lag_corrs = lag_correlation_table(df, [SUPPLY_CHAIN_PAIR], max_lag=max(lags))[0]
+        
+        print(f"Correlation (Diesel Price <-> Food CPI YoY): {lag_corrs[0]:.4f}")
         
         print("-> Checking Lag Effects (Diesel leads Food CPI):")
-        for lag in [1, 2, 3]:
-            # Leader(t) vs Follower(t+lag) -> Shift follower backwards
-            # Or Shift leader forward (Diesel_t vs Food_t+lag)
-            # Correct logic: df[Leader].shift(lag).corr(df[Follower])
-            lag_corr = df['Diesel_Price'].shift(lag).corr(df['CPI_Food_YoY'])
-            print(f"   - Lag {lag} month(s): {lag_corr:.4f}")
+        for lag in lags[1:]:
+            print(f"   - Lag {lag} month(s): {lag_corrs[lag]:.4f}")
     else:
         print("Missing columns for Supply Chain Analysis.")
 
 # ==============================================
 # [Analysis 3] Labor Market (Labor - Inflation)
 # ==============================================
-def analyze_labor_market(df):
+def analyze_labor_market(df, corrs=None):
     """
     Analyze the trade-off between Unemployment and Inflation.
+    - corrs: Lag correlations from precompute_correlations(); without it, only the lag-0 trade-off pair is correlated.
     """
     print("\n" + "="*80)
     print("[3-1. Laber Market] Inflation vs Unemployment")
     print("="*80)
     
     if 'Unemp_Total' in df.columns and 'CPI_Total_YoY' in df.columns:
-        # Calculate correlation
-        corr = df['Unemp_Total'].corr(df['CPI_Total_YoY'])
+        # Look up correlation
+        if corrs is None:
+            corrs = precompute_correlations(df, max_lag=0, pairs=[LABOR_TRADEOFF_PAIR])
+        corr = corrs[LABOR_TRADEOFF_PAIR][0]
         print(f"Correlation (Unemployment <-> Inflation): {corr:.4f}")
         
         if corr < -0.3:
@@ -106,20 +293,25 @@ def analyze_labor_market(df):
     else:
         print("Missing columns for Analysis.")
         
-def analyze_gender_gap(df):
+def analyze_gender_gap(df, cols=None):
     """
     Analyze gender asymmetry in unemployment rates.
+    - cols: Column arrays from column_arrays(); converted here if not given.
     """
     print("\n" + "="*80)
     print("[3-2. Labor Market Asymmetry] Gender Gap (Women - Men)")
     print("="*80)
     
     if 'Unemp_Women' in df.columns and 'Unemp_Men' in df.columns:
-        df['Gender_Gap'] = df['Unemp_Women'] - df['Unemp_Men']
+        if cols is None:
+            cols = column_arrays(df)
+        gap = cols['Unemp_Women'] - cols['Unemp_Men']
+        df['Gender_Gap'] = gap
         
-        mean_gap = df['Gender_Gap'].mean()
-        max_gap = df['Gender_Gap'].max()
-        max_date = df['Gender_Gap'].idxmax().date()
+        mean_gap = np.nanmean(gap)
+        max_pos = np.nanargmax(gap)
+        max_gap = gap[max_pos]
+        max_date = df.index[max_pos].date()
         
         print(f"Average Gap (2016-2025): {mean_gap:.3f}%p")
         print(f"Max Gap (Women > Men): {max_gap:.3f}%p occurred on {max_date}")
@@ -134,24 +326,30 @@ def analyze_gender_gap(df):
 # ====================================================
 # [Analysis 4] Structural Change (Energy(Gas) - Inflation)
 # ====================================================
-def analyze_structural_change(df):
+def analyze_structural_change(df, pre_covid=None, post_covid=None, cols=None):
     """
     Detect structural breaks in correlation (Pre vs Post COVID).
+    - pre_covid / post_covid: Slices from split_regimes(df); split here if not given.
+    - cols: Column arrays from column_arrays(); converted here if not given.
     """
     print("\n" + "="*80)
     print("[4. Structural Change] Correlation Shift (Energy vs Inflation)")
     print("="*80)
     
-    # Ensure date index is datetime
-    if not isinstance(df.index, pd.DatetimeIndex):
-        df.index = pd.to_datetime(df.index)
-
-    pre_covid = df[:'2019-12-31']
-    post_covid = df['2020-01-01':]
+    if pre_covid is None or post_covid is None:
+        # Ensure date index is datetime
+        if not isinstance(df.index, pd.DatetimeIndex):
+            df.index = pd.to_datetime(df.index)
+        pre_covid, post_covid = split_regimes(df)
     
     if not pre_covid.empty and not post_covid.empty and 'Gas_Price' in df.columns:
-        corr_pre = pre_covid['Gas_Price'].corr(pre_covid['CPI_Total_YoY'])
-        corr_post = post_covid['Gas_Price'].corr(post_covid['CPI_Total_YoY'])
+        if cols is None:
+            cols = column_arrays(df)
+        # The regimes are consecutive positional slices, so the arrays split at len(pre_covid)
+        split = len(pre_covid)
+        gas, cpi = cols['Gas_Price'], cols['CPI_Total_YoY']
+        corr_pre = pairwise_corr(gas[:split], cpi[:split])
+        corr_post = pairwise_corr(gas[split:], cpi[split:])
         
         print(f"Correlation (Pre-COVID, 2016-2019): {corr_pre:.4f}")
         print(f"Correlation (Post-COVID, 2020-2025): {corr_post:.4f}")
@@ -166,20 +364,24 @@ def analyze_structural_change(df):
 # ===========================================================
 # [Analysis 5] Economic Sensitivity (Energy(Oil) - Inflation)
 # ===========================================================
-def analyze_sensitivity(df):
+def analyze_sensitivity(df, cols=None):
     """
     Perform linear regression to find sensitivity of Inflation to Oil Prices.
+    - cols: Column arrays from column_arrays(); converted here if not given.
     """
     print("\n" + "="*80)
     print("[5. Economic Sensitivity] Oil Price Impact on Inflation")
     print("="*80)
     
     if 'Oil_Price' in df.columns and 'CPI_Total_YoY' in df.columns:
+        if cols is None:
+            cols = column_arrays(df)
         # Clean data for regression (remove NaNs and Infs)
-        clean_df = df[['Oil_Price', 'CPI_Total_YoY']].replace([np.inf, -np.inf], np.nan).dropna()
+        oil, cpi = cols['Oil_Price'], cols['CPI_Total_YoY']
+        valid = np.isfinite(oil) & np.isfinite(cpi)
         
-        if len(clean_df) > 10:
-            slope, intercept, r_value, p_value, std_err = stats.linregress(clean_df['Oil_Price'], clean_df['CPI_Total_YoY'])
+        if valid.sum() > 10:
+            slope, intercept, r_value, p_value, std_err = stats.linregress(oil[valid], cpi[valid])
             
             print(f"Slope (Beta): {slope:.4f}")
             print(f"R-squared: {r_value**2:.4f}")
@@ -192,32 +394,29 @@ def analyze_sensitivity(df):
 # ===========================================================================
 # [Analysis 6] Causal Chain Verification (Energy -> Inflation -> Labor -> News)
 # ===========================================================================
-def analyze_causal_chain(df):
+def analyze_causal_chain(df, corrs=None):
     """
     Verify the chain: Energy -> Inflation -> Labor -> News.
+    - corrs: Lag correlations from precompute_correlations(); without it, only the CAUSAL_CHAINS pairs are correlated.
     """
     print("\n" + "="*80)
     print("[6. Causal Chain Verification] Lag Correlation Analysis")
     print("Hypothesis: Energy -> Inflation -> Labor -> News Fear")
     print("="*80)
     
-    chains = [
-        ("Energy -> Inflation", "Gas_Price", "CPI_Total_YoY"),
-        ("Inflation -> Labor", "CPI_Total_YoY", "Unemp_Total"),
-        ("Labor -> News Fear", "Unemp_Total", "News_Total_Counting")
-    ]
+    if corrs is None:
+        corrs = precompute_correlations(df, max_lag=6, pairs=[(leader, follower) for _, leader, follower in CAUSAL_CHAINS])
     
-    for name, leader, follower in chains:
+    for name, leader, follower in CAUSAL_CHAINS:
         if leader in df.columns and follower in df.columns:
             print(f"\n[Link: {name}]")
             best_lag = 0
             best_corr = 0
             
+            # Corr(Leader_t, Follower_t+lag) for lags 0-6, looked up in the precomputed lag correlations
+            # e.g., Leader(Jan) vs Follower(Feb) -> Lag 1
             for lag in range(0, 7):
-                # Corr(Leader_t, Follower_t+lag)
-                # To calculate this, shift Follower BACKWARDS by lag
-                # e.g., Leader(Jan) vs Follower(Feb) -> Shift Follower(-1) to align Feb with Jan
-                corr = df[leader].corr(df[follower].shift(-lag))
+                corr = corrs[(leader, follower)][lag]
                 print(f"  - Lag {lag} month(s): {corr:.4f}")
                 
                 if abs(corr) > abs(best_corr):
@@ -232,16 +431,25 @@ def analyze_causal_chain(df):
 # Main Execution
 # ==========================================
 if __name__ == "__main__":
-    df = load_data()
+    df = load_data(columns=NUMERIC_COLS)
     
     if df is not None:
-        analyze_basic_stats(df)
-        analyze_supply_chain_impact(df)
-        analyze_labor_market(df)
-        analyze_gender_gap(df)
-        analyze_structural_change(df)
-        analyze_sensitivity(df)
-        analyze_causal_chain(df)
+        # Lag correlations reused by Analyses 2, 3 and 6 (one lag_correlation_table call)
+        corrs = precompute_correlations(df)
+        
+        # Pre/Post COVID regimes, located once by binary search on the sorted date index
+        pre, post = split_regimes(df)
+        
+        # Read-only column arrays shared by the analyses (no repeated DataFrame column lookups)
+        cols = column_arrays(df)
+        
+        analyze_basic_stats(df, cols)
+        analyze_supply_chain_impact(df, corrs)
+        analyze_labor_market(df, corrs)
+        analyze_gender_gap(df, cols)
+        analyze_structural_change(df, pre, post, cols)
+        analyze_sensitivity(df, cols)
+        analyze_causal_chain(df, corrs)
         
         print("\n" + "="*80)
         print("Analysis Complete. Results printed to console.")
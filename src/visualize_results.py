@@ -1,7 +1,12 @@
+import os
+import matplotlib
 import matplotlib.pyplot as plt
 import seaborn as sns
 import pandas as pd
 import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from scipy.stats import gaussian_kde
+from run_analysis import load_data, lag_correlation_table, split_regimes, BASE_DIR
 
 # ==========================================
 # [Setup] Style Settings
@@ -12,6 +17,35 @@ plt.rcParams['figure.figsize'] = (14, 8)
 plt.rcParams['axes.titlesize'] = 16
 plt.rcParams['axes.titleweight'] = 'bold'
 
+# ==========================================
+# [Helper] Plain Matplotlib Primitives
+# ==========================================
+# Line and scatter plots are drawn with Matplotlib directly: seaborn's wrappers rebuild a long-form frame and run
+# semantic mapping on every call. Seaborn is kept for the statistical plots (heatmap, regplot, histplot).
+def plot_kde(ax, values, color, label, alpha=0.3, gridsize=200, cut=3):
+    """
+    Filled Gaussian KDE (Scott bandwidth) of a 1-D Series, drawn like sns.kdeplot(fill=True).
+    """
+    values = values.dropna().to_numpy(dtype=np.float64)
+    kde = gaussian_kde(values)
+    bw = np.sqrt(kde.covariance[0, 0])
+    support = np.linspace(values.min() - cut * bw, values.max() + cut * bw, gridsize)
+    poly = ax.fill_between(support, 0, kde(support), facecolor=matplotlib.colors.to_rgba(color, alpha), edgecolor=color, label=label)
+    poly.sticky_edges.y[:] = [0, np.inf]
+
+def plot_line(ax, series, **kwargs):
+    """
+    Line plot of a Series against its index, skipping missing months (as sns.lineplot does).
+    """
+    series = series.dropna()
+    return ax.plot(series.index.values, series.to_numpy(), **kwargs)
+
+def scatter_linewidth(s):
+    """
+    Marker edge width seaborn uses for white-edged scatter markers of size s.
+    """
+    return .08 * np.sqrt(s)
+
 # ==========================================
 # [Analysis 1] Basic Statistics & Characteristics
 # ==========================================
@@ -22,16 +56,17 @@ def plot_analysis1_dashboard(df: pd.DataFrame) -> plt.Figure:
 
     # (A) Volatility (Flexible(Energy) vs Sticky(Shelter))
     if 'CPI_Energy_YoY' in df.columns and 'CPI_Shelter_YoY' in df.columns:
-        sns.lineplot(data=df, x=df.index, y='CPI_Energy_YoY', ax=axes[0], color='tab:red', alpha=0.5, label='Energy (High Volatility)')
-        sns.lineplot(data=df, x=df.index, y='CPI_Shelter_YoY', ax=axes[0], color='tab:blue', linewidth=3, label='Shelter (Sticky)')
+        plot_line(axes[0], df['CPI_Energy_YoY'], color='tab:red', alpha=0.5, label='Energy (High Volatility)')
+        plot_line(axes[0], df['CPI_Shelter_YoY'], color='tab:blue', linewidth=3, label='Shelter (Sticky)')
         axes[0].set_title("(A) Volatility: Flexible vs Sticky", fontsize=14, fontweight='bold')
+        axes[0].set_xlabel(df.index.name)
         axes[0].set_ylabel("YoY Inflation (%)")
         axes[0].legend()
 
     # (B) Asymmetry (Labor Gender)
     if 'Unemp_Men' in df.columns and 'Unemp_Women' in df.columns:
-        sns.kdeplot(data=df, x='Unemp_Men', ax=axes[1], fill=True, color='tab:blue', label='Men', alpha=0.3)
-        sns.kdeplot(data=df, x='Unemp_Women', ax=axes[1], fill=True, color='tab:pink', label='Women', alpha=0.3)
+        plot_kde(axes[1], df['Unemp_Men'], color='tab:blue', label='Men', alpha=0.3)
+        plot_kde(axes[1], df['Unemp_Women'], color='tab:pink', label='Women', alpha=0.3)
         axes[1].set_title("(B) Asymmetry: Gender Gap Distribution", fontsize=14, fontweight='bold')
         axes[1].set_xlabel("Unemployment Rate (%)")
         axes[1].set_ylabel("Density (Frequency)")
@@ -58,12 +93,13 @@ def plot_analysis1_sticky_inflation(df: pd.DataFrame) -> plt.Figure:
     ax.set_title("Analysis 1-2: Sticky vs Flexible Inflation (Time Series)", fontsize=16, fontweight='bold')
     
     if 'CPI_Shelter_YoY' in df.columns:
-        sns.lineplot(data=df, x=df.index, y='CPI_Shelter_YoY', ax=ax, color='tab:blue', linewidth=3, label='Shelter (Sticky)')
+        plot_line(ax, df['CPI_Shelter_YoY'], color='tab:blue', linewidth=3, label='Shelter (Sticky)')
     if 'CPI_Energy_YoY' in df.columns:
-        sns.lineplot(data=df, x=df.index, y='CPI_Energy_YoY', ax=ax, color='tab:red', linewidth=1.5, linestyle=':', label='Energy (Volatile)')
+        plot_line(ax, df['CPI_Energy_YoY'], color='tab:red', linewidth=1.5, linestyle=':', label='Energy (Volatile)')
     if 'CPI_Total_YoY' in df.columns:
-        sns.lineplot(data=df, x=df.index, y='CPI_Total_YoY', ax=ax, color='black', linewidth=1, alpha=0.5, label='Total CPI')
+        plot_line(ax, df['CPI_Total_YoY'], color='black', linewidth=1, alpha=0.5, label='Total CPI')
     
+    ax.set_xlabel(df.index.name)
     ax.set_ylabel('YoY Inflation (%)')
     ax.legend()
     return fig
@@ -81,8 +117,10 @@ def plot_analysis1_misery_index(df: pd.DataFrame) -> plt.Figure:
     
     ax2 = ax1.twinx()
     if 'News_Total_Counting' in df.columns:
-        sns.lineplot(x=df.index, y=df['News_Total_Counting'], ax=ax2, color='black', linewidth=2, label='Total Fear News Count')
+        plot_line(ax2, df['News_Total_Counting'], color='black', linewidth=2, label='Total Fear News Count')
+        ax2.set_xlabel(df.index.name)
         ax2.set_ylabel('Total News Volume', color='black')
+        ax2.legend()
         
     fig.legend(loc='upper left', bbox_to_anchor=(0.1, 0.9))
     return fig
@@ -97,14 +135,16 @@ def plot_analysis2_supply_chain(df: pd.DataFrame) -> plt.Figure:
     
     ax1.set_ylabel('Diesel Price ($/gal)', color='black', fontsize=12)
     if 'Diesel_Price' in df.columns:
-        sns.lineplot(data=df, x=df.index, y='Diesel_Price', ax=ax1, color='black', linewidth=2, label='Diesel (Transport Cost)')
+        plot_line(ax1, df['Diesel_Price'], color='black', linewidth=2, label='Diesel (Transport Cost)')
+        ax1.set_xlabel(df.index.name)
     ax1.tick_params(axis='y', labelcolor='black')
     ax1.legend(loc='upper left')
 
     ax2 = ax1.twinx()
     ax2.set_ylabel('CPI Food YoY (%)', color='green', fontsize=12)
     if 'CPI_Food_YoY' in df.columns:
-        sns.lineplot(data=df, x=df.index, y='CPI_Food_YoY', ax=ax2, color='green', linestyle='--', linewidth=2, label='Food Inflation')
+        plot_line(ax2, df['CPI_Food_YoY'], color='green', linestyle='--', linewidth=2, label='Food Inflation')
+        ax2.set_xlabel(df.index.name)
     ax2.tick_params(axis='y', labelcolor='green')
     ax2.legend(loc='upper right')
     return fig
@@ -112,30 +152,31 @@ def plot_analysis2_supply_chain(df: pd.DataFrame) -> plt.Figure:
 # ==============================================
 # [Analysis 3] Labor Market (Labor - Inflation)
 # ==============================================
-def plot_analysis3_labor_tradeoff(df: pd.DataFrame) -> plt.Figure:
+def plot_analysis3_labor_tradeoff(df: pd.DataFrame, pre_2020: pd.DataFrame = None, post_2020: pd.DataFrame = None) -> plt.Figure:
     """
     [Analysis 3-1] Inflation vs Unemployment Trade-off (Split Regime).
     Separates Pre-2020 and Post-2020 to reveal distinct patterns.
+    pre_2020 / post_2020: Slices from split_regimes(df); split here if not given.
     """
     fig, ax = plt.subplots()
     ax.set_title("Analysis 3-1: Labor Market Trade-off", fontsize=16, fontweight='bold')
     
     if 'Unemp_Total' in df.columns and 'CPI_Total_YoY' in df.columns:
         # Split data into Pre/Post 2020
-        pre_2020 = df[:'2019-12-31']
-        post_2020 = df['2020-01-01':]
+        if pre_2020 is None or post_2020 is None:
+            pre_2020, post_2020 = split_regimes(df)
         
         # 1. Pre-2020 Period (Stable)
-        sns.scatterplot(data=pre_2020, x='Unemp_Total', y='CPI_Total_YoY', 
-                        color='tab:blue', s=80, alpha=0.7, ax=ax, label='Pre-2020 (Stable)')
+        ax.scatter(pre_2020['Unemp_Total'], pre_2020['CPI_Total_YoY'], 
+                   color='tab:blue', s=80, alpha=0.7, edgecolor='w', linewidth=scatter_linewidth(80), label='Pre-2020 (Stable)')
         # Regression Line (Pre)
         if len(pre_2020) > 1:
             sns.regplot(data=pre_2020, x='Unemp_Total', y='CPI_Total_YoY', 
                         scatter=False, ax=ax, color='tab:blue', line_kws={'linestyle':'--', 'alpha':0.5})
         
         # 2. Post-2020 Period (Shock)
-        sns.scatterplot(data=post_2020, x='Unemp_Total', y='CPI_Total_YoY', 
-                        color='tab:red', s=80, alpha=0.7, ax=ax, label='Post-2020 (Shock)')
+        ax.scatter(post_2020['Unemp_Total'], post_2020['CPI_Total_YoY'], 
+                   color='tab:red', s=80, alpha=0.7, edgecolor='w', linewidth=scatter_linewidth(80), label='Post-2020 (Shock)')
         # Regression Line (Post)
         if len(post_2020) > 1:
             sns.regplot(data=post_2020, x='Unemp_Total', y='CPI_Total_YoY', 
@@ -160,8 +201,9 @@ def plot_analysis3_gender_gap(df: pd.DataFrame) -> plt.Figure:
     ax.set_title("Analysis 3-2: Gender Asymmetry in Labor Market", fontsize=16, fontweight='bold')
     
     if 'Unemp_Men' in df.columns and 'Unemp_Women' in df.columns:
-        sns.lineplot(data=df, x=df.index, y='Unemp_Men', ax=ax, color='tab:blue', label='Men')
-        sns.lineplot(data=df, x=df.index, y='Unemp_Women', ax=ax, color='tab:pink', label='Women')
+        plot_line(ax, df['Unemp_Men'], color='tab:blue', label='Men')
+        plot_line(ax, df['Unemp_Women'], color='tab:pink', label='Women')
+        ax.set_xlabel(df.index.name)
         
         ax.fill_between(df.index, df['Unemp_Men'], df['Unemp_Women'], 
                         where=(df['Unemp_Women'] > df['Unemp_Men']), color='tab:pink', alpha=0.3, label='Women > Men')
@@ -181,9 +223,12 @@ def plot_analysis4_structural_change(df: pd.DataFrame) -> plt.Figure:
     ax.set_title("Analysis 4: Structural Change (Gas Price vs CPI)", fontsize=16, fontweight='bold')
     
     if 'Gas_Price' in df.columns and 'CPI_Total_YoY' in df.columns:
-        rolling_corr = df['Gas_Price'].rolling(window=12).corr(df['CPI_Total_YoY'])
+        # 12-month rolling correlation from rolling moments (cov / (std_x * std_y)), all computed in C
+        x, y = df['Gas_Price'], df['CPI_Total_YoY']
+        rolling_corr = x.rolling(window=12).cov(y) / (x.rolling(window=12).std() * y.rolling(window=12).std())
         
-        sns.lineplot(x=rolling_corr.index, y=rolling_corr, ax=ax, color='purple', linewidth=2.5)
+        plot_line(ax, rolling_corr, color='purple', linewidth=2.5)
+        ax.set_xlabel(rolling_corr.index.name)
         ax.axhline(0, color='gray', linestyle='--')
         ax.set_ylim(-1, 1)
         ax.set_ylabel('Correlation Coefficient')
@@ -202,7 +247,10 @@ def plot_analysis5_sensitivity_scatter(df: pd.DataFrame) -> plt.Figure:
     ax.set_title("Analysis 5: Economic Sensitivity (Oil Price vs Inflation)", fontsize=16, fontweight='bold')
     
     if 'Oil_Price' in df.columns and 'CPI_Total_YoY' in df.columns:
-        sns.scatterplot(data=df, x='Oil_Price', y='CPI_Total_YoY', hue=df.index.year, palette='viridis', s=100, ax=ax)
+        # Points colored by year (one legend entry per year)
+        points = ax.scatter(df['Oil_Price'], df['CPI_Total_YoY'], c=df.index.year, cmap='viridis', s=100,
+                            edgecolor='w', linewidth=scatter_linewidth(100))
+        ax.legend(*points.legend_elements(), title=df.index.name)
         sns.regplot(data=df, x='Oil_Price', y='CPI_Total_YoY', scatter=False, ax=ax, color='red', line_kws={'linestyle':'--'})
         
         ax.set_xlabel('WTI Crude Oil Price ($/barrel)')
@@ -224,20 +272,12 @@ def plot_analysis6_causal_heatmap(df: pd.DataFrame) -> plt.Figure:
     }
     
     lags = [0, 1, 2, 3, 4, 5, 6]
-    heatmap_data = []
-    valid_labels = []
-    
-    for label, (leader, follower) in chain_pairs.items():
-        if leader in df.columns and follower in df.columns:
-            corrs = []
-            for lag in lags:
-                c = df[leader].corr(df[follower].shift(-lag)) 
-                corrs.append(c)
-            heatmap_data.append(corrs)
-            valid_labels.append(label)
+    valid_pairs = {label: pair for label, pair in chain_pairs.items() if pair[0] in df.columns and pair[1] in df.columns}
     
-    if heatmap_data:
-        df_hm = pd.DataFrame(heatmap_data, index=valid_labels, columns=[f"Lag {i}m" for i in lags])
+    if valid_pairs:
+        # Every pair x lag correlation in one compiled call
+        heatmap_data = lag_correlation_table(df, list(valid_pairs.values()), max_lag=max(lags))[:, lags]
+        df_hm = pd.DataFrame(heatmap_data, index=list(valid_pairs), columns=[f"Lag {i}m" for i in lags])
         sns.heatmap(df_hm, annot=True, cmap='RdBu_r', center=0, fmt=".2f", linewidths=1, ax=ax)
         ax.set_title("Analysis 6-1: Causal Chain Lag Heatmap", fontsize=16, fontweight='bold')
         ax.set_xlabel("Time Lag (Months after Shock)", fontsize=12)
@@ -262,7 +302,8 @@ def plot_analysis6_news_lag(df: pd.DataFrame) -> plt.Figure:
     
     if 'Unemp_Total' in df.columns:
         ax2 = ax1.twinx()
-        sns.lineplot(data=df, x=df.index, y='Unemp_Total', ax=ax2, color='tab:red', linewidth=2.5, label='Unemployment Rate')
+        plot_line(ax2, df['Unemp_Total'], color='tab:red', linewidth=2.5, label='Unemployment Rate')
+        ax2.set_xlabel(df.index.name)
         ax2.set_ylabel('Unemployment Rate (%)', color='tab:red', fontweight='bold')
         ax2.tick_params(axis='y', labelcolor='tab:red')
         ax2.legend(loc='upper right')
@@ -285,4 +326,64 @@ def plot_analysis6_news_evolution(df: pd.DataFrame) -> plt.Figure:
         ax.set_ylabel('Monthly Mention Count')
         ax.legend(loc='upper left')
         
-    return fig
\ No newline at end of file
+    return fig
+
+# ==========================================
+# [Batch] Render All Figures in Parallel
+# ==========================================
+RESULTS_DIR = os.path.join(BASE_DIR, 'results')
+
+# (Output file name, plot function name) for every figure in the report
+PLOTS = [
+    ("[Analysis 1-1] Comprehensive Dashboard", "plot_analysis1_dashboard"),
+    ("[Analysis 1-2] Detailed View of Sticky vs Flexible Inflation", "plot_analysis1_sticky_inflation"),
+    ("[Analysis 1-3] Macro View_The Misery Index", "plot_analysis1_misery_index"),
+    ("[Analysis 2] Diesel Price vs Food CPI", "plot_analysis2_supply_chain"),
+    ("[Analysis 3-1] Inflation vs Unemployment Trade-off (Split Regime)", "plot_analysis3_labor_tradeoff"),
+    ("[Analysis 3-2] Gender Unemployment Asymmetry", "plot_analysis3_gender_gap"),
+    ("[Analysis 4] Structural Change_ Rolling Correlation", "plot_analysis4_structural_change"),
+    ("[Analysis 5] Economic Sensitivity", "plot_analysis5_sensitivity_scatter"),
+    ("[Analysis 6-1] Causal Chain Heatmap", "plot_analysis6_causal_heatmap"),
+    ("[Analysis 6-2] News Lag (Job Fear)", "plot_analysis6_news_lag"),
+    ("[Analysis 6-3] Fear Narrative Evolution", "plot_analysis6_news_evolution")
+]
+
+def render_one(name, fn_name, df, outdir):
+    """
+    Worker: Renders one plot function headlessly (Agg) and saves it as <outdir>/<name>.png.
+    Returns: Path of the saved PNG (figures themselves do not pickle, so only the path travels back).
+    """
+    matplotlib.use('Agg')
+    fig = globals()[fn_name](df)
+    save_path = os.path.join(outdir, f"{name}.png")
+    fig.savefig(save_path, bbox_inches='tight')
+    plt.close(fig)
+    return save_path
+
+def render_all(df: pd.DataFrame, outdir: str = RESULTS_DIR) -> list:
+    """
+    Renders every figure in PLOTS to PNG files in outdir on a process pool of half the CPU cores (at least one worker).
+    - The plot functions are independent and CPU-bound, so they run side by side instead of serially; each worker renders several figures in turn.
+    Returns: List of saved PNG paths (in PLOTS order).
+    """
+    os.makedirs(outdir, exist_ok=True)
+    max_workers = max(1, (os.cpu_count() or 2) // 2)  # Leave headroom instead of oversubscribing the cores
+    
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(render_one, name, fn_name, df, outdir) for name, fn_name in PLOTS]
+        paths = []
+        for (name, _), future in zip(PLOTS, futures):
+            try:
+                paths.append(future.result())
+                print(f" -> Saved {name}")
+            except Exception as e:
+                print(f" -> [Error] {name}: {e}")
+    return paths
+
+if __name__ == "__main__":
+    # Full column set: the plots use the CPI levels and news counts as well as NUMERIC_COLS
+    df = load_data()
+    
+    if df is not None:
+        print(f"Rendering {len(PLOTS)} figures to: {RESULTS_DIR}")
+        render_all(df)
@@ -0,0 +1,36 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from run_analysis import lag_correlation_table
+
+# ==========================================
+# lag_correlation_table vs Series.corr
+# ==========================================
+def test_constant_column_gives_nan():
+    """
+    A zero-variance column has no correlation at any lag (NaN, as Series.corr), not a clamped -1.0.
+    """
+    df = pd.DataFrame({'x': np.arange(20, dtype=float), 'flat': np.full(20, 3.0)})
+    table = lag_correlation_table(df, [('x', 'flat'), ('flat', 'x')], max_lag=3)
+
+    for lag in range(4):
+        assert np.isnan(df['x'].corr(df['flat'].shift(-lag)))
+    assert np.isnan(table).all()
+
+def test_matches_series_corr_with_gaps():
+    """
+    Every lag matches leader.corr(follower.shift(-lag)), NaN rows included.
+    """
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(rng.normal(size=(60, 2)), columns=['a', 'b'])
+    df.iloc[[3, 17, 40], 0] = np.nan
+    df.iloc[[5, 41], 1] = np.nan
+    table = lag_correlation_table(df, [('a', 'b')], max_lag=6)
+
+    expected = [df['a'].corr(df['b'].shift(-lag)) for lag in range(7)]
+    np.testing.assert_allclose(table[0], expected, rtol=1e-12)